@@ -3,16 +3,38 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import time
 import voluptuous as vol
 
 from homeassistant.const import Platform
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, ServiceCall
+from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import config_validation as cv, discovery
 from homeassistant.helpers.typing import ConfigType
-
-from .const import DOMAIN
+from homeassistant.helpers.update_coordinator import UpdateFailed
+
+from .const import (
+    DEFAULT_BURST_DURATION,
+    DEFAULT_BURST_INTERVAL,
+    DEFAULT_MAX_SCAN_INTERVAL,
+    DEFAULT_MIN_SCAN_INTERVAL,
+    DEFAULT_SETUP_CONCURRENCY,
+    DEFAULT_STALE_GRACE_PERIOD,
+    DOMAIN,
+    MAX_BURST_DURATION,
+    MAX_BURST_INTERVAL,
+    MIN_BURST_INTERVAL,
+    SENSOR_PUBLISH_DEFAULTS,
+    SERVICE_BURST_POLL,
+    SETUP_PROBE_TIMEOUT,
+    SETUP_RETRY_MAX_DELAY,
+    SETUP_RETRY_MIN_DELAY,
+)
 from .coordinator import MainCoordinator
+from .open_pico_local_api.pico_client import PicoClient
 from .pico_manager import PicoClientManager
+from .poll_scheduler import FleetPollScheduler
+from .snapshot_store import SnapshotStore
 
 
 _LOGGER = logging.getLogger(__name__)
@@ -34,6 +56,25 @@ DEVICE_SCHEMA = vol.Schema({
     vol.Optional("name"): cv.string,  # Optional friendly name
 })
 
+# Publishing options of one measurement sensor
+SENSOR_PUBLISH_SCHEMA = vol.Schema({
+    vol.Optional("deadband"): vol.All(vol.Coerce(float), vol.Range(min=0)),
+    vol.Optional("deadband_percent"): vol.All(vol.Coerce(float), vol.Range(min=0)),
+    vol.Optional("min_interval"): vol.All(vol.Coerce(float), vol.Range(min=0)),
+    vol.Optional("max_interval"): vol.All(vol.Coerce(float), vol.Range(min=1)),
+})
+
+# Schema of the burst_poll service
+BURST_POLL_SCHEMA = vol.Schema({
+    vol.Required("device"): cv.string,  # IP address, name or device ID
+    vol.Optional("interval", default=DEFAULT_BURST_INTERVAL): vol.All(
+        vol.Coerce(float), vol.Range(min=MIN_BURST_INTERVAL, max=MAX_BURST_INTERVAL)
+    ),
+    vol.Optional("duration", default=DEFAULT_BURST_DURATION): vol.All(
+        vol.Coerce(float), vol.Range(min=1, max=MAX_BURST_DURATION)
+    ),
+})
+
 # Define your YAML configuration schema
 CONFIG_SCHEMA = vol.Schema(
     {
@@ -41,6 +82,23 @@ CONFIG_SCHEMA = vol.Schema(
             vol.Required("devices"): vol.All(cv.ensure_list, [DEVICE_SCHEMA]),
             vol.Optional("local_port", default=40069): cv.port,
             vol.Optional("verbose", default=False): cv.boolean,
+            vol.Optional("max_packets_per_second", default=100.0): vol.All(vol.Coerce(float), vol.Range(min=0)),
+            vol.Optional("device_packets_per_second", default=10.0): vol.All(vol.Coerce(float), vol.Range(min=0)),
+            vol.Optional("min_scan_interval", default=DEFAULT_MIN_SCAN_INTERVAL): vol.All(
+                vol.Coerce(float), vol.Range(min=1)
+            ),
+            vol.Optional("max_scan_interval", default=DEFAULT_MAX_SCAN_INTERVAL): vol.All(
+                vol.Coerce(float), vol.Range(min=1)
+            ),
+            vol.Optional("setup_concurrency", default=DEFAULT_SETUP_CONCURRENCY): vol.All(
+                vol.Coerce(int), vol.Range(min=1)
+            ),
+            vol.Optional("stale_grace_period", default=DEFAULT_STALE_GRACE_PERIOD): vol.All(
+                vol.Coerce(float), vol.Range(min=0)
+            ),
+            vol.Optional("sensor_publish", default={}): vol.Schema({
+                vol.Optional(sensor): SENSOR_PUBLISH_SCHEMA for sensor in SENSOR_PUBLISH_DEFAULTS
+            }),
         })
     },
     extra=vol.ALLOW_EXTRA,
@@ -59,6 +117,12 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     devices = domain_config.get("devices", [])
     local_port = domain_config.get("local_port", 40069)
     verbose = domain_config.get("verbose", False)
+    max_packets_per_second = domain_config.get("max_packets_per_second", 100.0)
+    device_packets_per_second = domain_config.get("device_packets_per_second", 10.0)
+    min_scan_interval = domain_config.get("min_scan_interval", DEFAULT_MIN_SCAN_INTERVAL)
+    max_scan_interval = domain_config.get("max_scan_interval", DEFAULT_MAX_SCAN_INTERVAL)
+    setup_concurrency = domain_config.get("setup_concurrency", DEFAULT_SETUP_CONCURRENCY)
+    stale_grace_period = domain_config.get("stale_grace_period", DEFAULT_STALE_GRACE_PERIOD)
 
     _LOGGER.info("Setting up %s with %d device(s)", DOMAIN, len(devices))
 
@@ -68,7 +132,13 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     hass.data[DOMAIN]["config"] = domain_config
 
     # Create shared PicoClient manager
-    manager = PicoClientManager(local_port=local_port, verbose=verbose)
+    manager = PicoClientManager(
+        local_port=local_port,
+        verbose=verbose,
+        max_packets_per_second=max_packets_per_second,
+        device_packets_per_second=device_packets_per_second,
+        fleet_concurrency=setup_concurrency,
+    )
 
     try:
         await manager.initialize()
@@ -78,80 +148,26 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
         _LOGGER.error("Failed to initialize shared transport: %s", err, exc_info=True)
         return False
 
-    # Create clients and coordinators for each device
-    successful_devices = 0
+    # Create one client and coordinator per device up front, so every entity
+    # exists (unavailable) from the start and devices come online later
+    device_names: dict[str, str] = {}
     for idx, device_config in enumerate(devices):
         pico_ip = device_config.get("ip")
-        pin = device_config.get("pin")
         device_name = device_config.get("name", f"Pico Device {idx + 1}")
+        device_id = f"pico_{pico_ip.replace('.', '_')}"
 
         _LOGGER.debug("Setting up device '%s': ip=%s", device_name, pico_ip)
 
         try:
             # Create client with shared socket
-            device_id = f"pico_{pico_ip.replace('.', '_')}"
             client = manager.create_client(
                 ip=pico_ip,
-                pin=pin,
+                pin=device_config.get("pin"),
                 device_id=device_id,
                 timeout=15,
                 retry_attempts=3,
                 retry_delay=2.0
             )
-
-            # Connect to device
-            await client.connect()
-            _LOGGER.debug("Connected to device '%s' at %s", device_name, pico_ip)
-
-            # Initialize the coordinator for this device
-            coordinator = MainCoordinator(hass, client, device_name)
-
-            # Perform initial data load with timeout
-            try:
-                async with asyncio.timeout(30):
-                    await coordinator.async_refresh()
-
-                    # Check if refresh encountered an error
-                    if not coordinator.last_update_success:
-                        raise Exception(
-                            f"Initial refresh failed: {coordinator.last_exception}"
-                        )
-
-            except asyncio.TimeoutError:
-                _LOGGER.error(
-                    "Timeout during initial refresh for device '%s' (%s). "
-                    "Check if device is reachable and PIN is correct.",
-                    device_name, pico_ip
-                )
-                await client.disconnect()
-                continue
-            except Exception as err:
-                _LOGGER.error(
-                    "Initial refresh failed for device '%s' (%s): %s",
-                    device_name, pico_ip, err
-                )
-                await client.disconnect()
-                continue
-
-            # Check if we got data
-            if not coordinator.data:
-                _LOGGER.error("Failed to fetch initial data from device '%s' (%s)", device_name, pico_ip)
-                await client.disconnect()
-                continue
-
-            # Store coordinator in our list
-            hass.data[DOMAIN]["coordinators"].append(coordinator)
-            successful_devices += 1
-
-            _LOGGER.info(
-                "Successfully set up device '%s' (%s): Mode=%s, Temp=%.1f°C, Humidity=%.1f%%",
-                device_name,
-                pico_ip,
-                coordinator.data.operating.mode.name,
-                coordinator.data.sensors.temperature,
-                coordinator.data.sensors.humidity
-            )
-
         except Exception as err:
             _LOGGER.error(
                 "Error setting up device '%s' (%s): %s",
@@ -159,16 +175,46 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
             )
             continue
 
-    # Check if we have at least one successful coordinator
-    if successful_devices == 0:
+        device_names[device_id] = device_name
+        hass.data[DOMAIN]["coordinators"].append(
+            MainCoordinator(
+                hass,
+                client,
+                device_name,
+                min_scan_interval=min_scan_interval,
+                max_scan_interval=max_scan_interval,
+                stale_grace_period=stale_grace_period,
+                sensor_publish=domain_config.get("sensor_publish"),
+            )
+        )
+
+    if not device_names:
         _LOGGER.error("No devices were successfully set up")
         await manager.shutdown()
         return False
 
-    _LOGGER.info(
-        "Successfully set up %s with %d/%d device(s)",
-        DOMAIN, successful_devices, len(devices)
-    )
+    # Show the last-known status right away; the first live poll replaces it
+    snapshot_store = SnapshotStore(hass)
+    await snapshot_store.async_load()
+    for coordinator in hass.data[DOMAIN]["coordinators"]:
+        coordinator.async_restore_snapshot(snapshot_store)
+
+    # One timer polls the whole fleet, with the devices spread over the interval.
+    # Devices join it once they are up.
+    poll_scheduler = FleetPollScheduler(hass)
+    poll_scheduler.async_start()
+    hass.data[DOMAIN]["poll_scheduler"] = poll_scheduler
+
+    async def _async_burst_poll(call: ServiceCall) -> None:
+        """Temporarily poll one device at a fixed fast interval."""
+        device = call.data["device"]
+        for coordinator in hass.data[DOMAIN]["coordinators"]:
+            if device in (coordinator.pico_ip, coordinator.device_name, coordinator.device_id):
+                coordinator.async_start_burst(call.data["interval"], call.data["duration"])
+                return
+        raise HomeAssistantError(f"Unknown {DOMAIN} device: {device}")
+
+    hass.services.async_register(DOMAIN, SERVICE_BURST_POLL, _async_burst_poll, schema=BURST_POLL_SCHEMA)
 
     # Load platforms using discovery
     for platform in PLATFORMS:
@@ -178,6 +224,90 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
             )
         )
 
+    coordinators = {coordinator.device_id: coordinator for coordinator in hass.data[DOMAIN]["coordinators"]}
+
+    async def _async_bring_up(client: PicoClient) -> MainCoordinator:
+        """Connect, probe and load the first data of one device."""
+        coordinator = coordinators[client.device_id]
+
+        await client.connect()
+        _LOGGER.debug("Connected to device '%s' at %s", coordinator.device_name, client.ip)
+
+        # Quick single-attempt probe, so unreachable devices fail fast. Its answer
+        # is published as the initial data
+        try:
+            async with asyncio.timeout(SETUP_PROBE_TIMEOUT):
+                await coordinator.async_probe()
+        except (asyncio.TimeoutError, TimeoutError) as err:
+            raise TimeoutError(
+                f"No answer to liveness probe within {SETUP_PROBE_TIMEOUT}s. "
+                "Check if device is reachable and PIN is correct."
+            ) from err
+
+        # Check if we got data
+        if not coordinator.data:
+            raise Exception("Failed to fetch initial data")
+
+        return coordinator
+
+    async def _async_bring_up_all() -> None:
+        """Bring devices online in rounds, retrying failed ones with backoff."""
+        pending = list(device_names)
+        retry_delay = SETUP_RETRY_MIN_DELAY
+        setup_started = time.monotonic()
+
+        while pending:
+            failed = []
+            async for result in manager.fleet.stream(_async_bring_up, pending):
+                coordinator = coordinators[result.device_id]
+
+                if not result.ok:
+                    _LOGGER.warning(
+                        "Setup failed for device '%s' (%s) after %.1fs, retrying in %ds: %s",
+                        coordinator.device_name, coordinator.pico_ip, result.elapsed, retry_delay, result.error
+                    )
+                    # A restored snapshot still counts as a successful update: record
+                    # the failure so its grace period starts running
+                    if coordinator.last_update_success:
+                        coordinator.async_set_update_error(UpdateFailed(f"Setup failed: {result.error}"))
+
+                    await coordinator.client.disconnect()
+                    failed.append(result.device_id)
+                    continue
+
+                poll_scheduler.async_add(coordinator)
+                _LOGGER.info(
+                    "Successfully set up device '%s' (%s) in %.1fs: Mode=%s, Temp=%.1f°C, Humidity=%.1f%%",
+                    coordinator.device_name,
+                    coordinator.pico_ip,
+                    time.monotonic() - setup_started,
+                    coordinator.data.operating.mode.name,
+                    coordinator.data.sensors.temperature,
+                    coordinator.data.sensors.humidity
+                )
+
+            # Keep configuration order between rounds
+            pending = [device_id for device_id in pending if device_id in failed]
+            if not pending:
+                break
+
+            await asyncio.sleep(retry_delay)
+            retry_delay = min(retry_delay * 2, SETUP_RETRY_MAX_DELAY)
+
+        _LOGGER.info(
+            "All %d device(s) of %s are online after %.1fs",
+            len(device_names), DOMAIN, time.monotonic() - setup_started
+        )
+
+    hass.data[DOMAIN]["bring_up_task"] = hass.async_create_background_task(
+        _async_bring_up_all(), name=f"{DOMAIN} device bring-up"
+    )
+
+    _LOGGER.info(
+        "Set up %s with %d device(s), bringing them online in the background (concurrency %d)",
+        DOMAIN, len(device_names), setup_concurrency
+    )
+
     return True
 
 
@@ -185,6 +315,12 @@ async def async_unload_entry(hass: HomeAssistant) -> bool:
     """Unload the integration."""
     _LOGGER.info("Unloading %s integration", DOMAIN)
 
+    # Stop bringing devices up and polling before the coordinators and clients go away
+    if DOMAIN in hass.data and "bring_up_task" in hass.data[DOMAIN]:
+        hass.data[DOMAIN]["bring_up_task"].cancel()
+    if DOMAIN in hass.data and "poll_scheduler" in hass.data[DOMAIN]:
+        await hass.data[DOMAIN]["poll_scheduler"].async_stop()
+
     # Shutdown coordinators
     if DOMAIN in hass.data and "coordinators" in hass.data[DOMAIN]:
         for coordinator in hass.data[DOMAIN]["coordinators"]:
@@ -1,16 +1,82 @@
 """Base entity which all other entity platform classes can inherit."""
 
+from collections.abc import Callable
 import logging
+from typing import Any
 
 from homeassistant.core import callback
 from homeassistant.helpers.device_registry import DeviceInfo
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
+from .open_pico_local_api.models.pico_device_model import PicoDeviceModel
+
 from .const import DOMAIN
 from .coordinator import MainCoordinator
 
 _LOGGER = logging.getLogger(__name__)
 
+# Check of a device status telling whether an entity means anything for the device
+Capability = Callable[[PicoDeviceModel], bool]
+
+
+def has_air_quality(status: PicoDeviceModel) -> bool:
+    """Return True if the device has an air quality sensor."""
+    return status.sensors.has_air_quality
+
+
+def has_maintenance(status: PicoDeviceModel) -> bool:
+    """Return True if the device reports maintenance flags."""
+    return bool(status.device_info.maintenance)
+
+
+@callback
+def async_add_capable_entities(
+        coordinator: MainCoordinator,
+        async_add_entities: AddEntitiesCallback,
+        entities: list[tuple["BaseEntity", Capability | None]],
+) -> int:
+    """
+    Add the entities of a device whose capability is present.
+
+    Entities without a capability are always added. The others are added
+    once a status shows their capability, the current one if the device
+    already has data (live or restored), or a later update otherwise.
+    Returns the number of entities added right away.
+    """
+    ready = []
+    pending = []
+    for entity, capability in entities:
+        if capability is None or (coordinator.data is not None and capability(coordinator.data)):
+            ready.append(entity)
+        else:
+            pending.append((entity, capability))
+
+    if ready:
+        async_add_entities(ready)
+    if not pending:
+        return len(ready)
+
+    @callback
+    def _async_check_capabilities() -> None:
+        """Add the pending entities whose capability appeared."""
+        if coordinator.data is None:
+            return
+
+        appeared = [entity for entity, capability in pending if capability(coordinator.data)]
+        if not appeared:
+            return
+
+        pending[:] = [(entity, capability) for entity, capability in pending if entity not in appeared]
+        if not pending:
+            remove_listener()
+
+        _LOGGER.info("[%s] Adding %d entity(ies) for new capabilities", coordinator.device_name, len(appeared))
+        async_add_entities(appeared)
+
+    remove_listener = coordinator.async_add_listener(_async_check_capabilities)
+    return len(ready)
+
 
 class BaseEntity(CoordinatorEntity):
     """Base Entity Class for Open Pico devices."""
@@ -18,16 +84,30 @@ class BaseEntity(CoordinatorEntity):
     coordinator: MainCoordinator
     _attr_has_entity_name = True
 
+    # Raw status fields the entity's state is built from, None for all of them
+    _status_fields: frozenset[str] | None = None
+
     def __init__(self, coordinator: MainCoordinator, device_index: int) -> None:
         """Initialise entity."""
         super().__init__(coordinator)
         self.device_index = device_index
+        self._last_written: tuple[bool, bool] | None = None
 
     @callback
     def _handle_coordinator_update(self) -> None:
-        """Update entity with latest data from coordinator."""
+        """Write state if a field the entity reads, its availability or staleness changed."""
+        changed = self._state_changed()
+        written = (self.available, self.coordinator.is_stale)
+        if written == self._last_written and not changed:
+            return
+
+        self._last_written = written
         self.async_write_ha_state()
 
+    def _state_changed(self) -> bool:
+        """Check if the coordinator update may change the entity's state."""
+        return self.coordinator.fields_changed(self._status_fields)
+
     @property
     def device_info(self) -> DeviceInfo:
         """Return device information."""
@@ -48,7 +128,21 @@ class BaseEntity(CoordinatorEntity):
             sw_version=device_info.firmware_version,
         )
 
+    @property
+    def extra_state_attributes(self) -> dict[str, Any] | None:
+        """Flag values restored from storage or kept through failed updates."""
+        if not self.coordinator.is_stale:
+            return None
+
+        data_age = self.coordinator.data_age
+        return {
+            "stale": True,
+            "data_age": round(data_age) if data_age is not None else None,
+        }
+
     @property
     def available(self) -> bool:
-        """Return if entity is available."""
-        return self.coordinator.last_update_success and self.coordinator.data is not None
\ No newline at end of file
+        """Return if entity is available, which lasts through the stale grace period."""
+        if self.coordinator.data is None:
+            return False
+        return self.coordinator.last_update_success or self.coordinator.in_grace_period
\ No newline at end of file
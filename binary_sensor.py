@@ -10,7 +10,7 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.typing import ConfigType
 
 from .const import DOMAIN
-from .base import BaseEntity
+from .base import BaseEntity, async_add_capable_entities, has_maintenance
 from .coordinator import MainCoordinator
 
 _LOGGER = logging.getLogger(__name__)
@@ -29,13 +29,14 @@ async def async_setup_platform(
     # Get all coordinators from hass.data
     coordinators = hass.data[DOMAIN]["coordinators"]
 
-    # Create binary sensor entities for each coordinator/device
-    sensors = []
+    # Create binary sensor entities for each coordinator/device reporting maintenance flags
+    added = 0
     for idx, coordinator in enumerate(coordinators):
-        sensors.append(PicoMaintenanceBinarySensor(coordinator, idx))
+        added += async_add_capable_entities(coordinator, async_add_entities, [
+            (PicoMaintenanceBinarySensor(coordinator, idx), has_maintenance),
+        ])
 
-    async_add_entities(sensors)
-    _LOGGER.info("Added %d binary sensor(s)", len(sensors))
+    _LOGGER.info("Added %d binary sensor(s)", added)
 
 
 class PicoMaintenanceBinarySensor(BaseEntity, BinarySensorEntity):
@@ -44,6 +45,7 @@ class PicoMaintenanceBinarySensor(BaseEntity, BinarySensorEntity):
     _attr_translation_key = "filter_maintenance"
     _attr_device_class = BinarySensorDeviceClass.PROBLEM
     _attr_icon = "mdi:air-filter"
+    _status_fields = frozenset({"man"})
 
     def __init__(self, coordinator: MainCoordinator, device_index: int):
         """Initialize the sensor."""
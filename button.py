@@ -10,7 +10,7 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.typing import ConfigType
 
 from .const import DOMAIN
-from .base import BaseEntity
+from .base import BaseEntity, async_add_capable_entities, has_maintenance
 from .coordinator import MainCoordinator
 
 _LOGGER = logging.getLogger(__name__)
@@ -29,13 +29,14 @@ async def async_setup_platform(
     # Get all coordinators from hass.data
     coordinators = hass.data[DOMAIN]["coordinators"]
 
-    # Create button entities for each coordinator/device
-    buttons = []
+    # Create button entities for each coordinator/device reporting maintenance flags
+    added = 0
     for idx, coordinator in enumerate(coordinators):
-        buttons.append(PicoMaintenanceResetButton(coordinator, idx))
+        added += async_add_capable_entities(coordinator, async_add_entities, [
+            (PicoMaintenanceResetButton(coordinator, idx), has_maintenance),
+        ])
 
-    async_add_entities(buttons)
-    _LOGGER.info("Added %d button(s)", len(buttons))
+    _LOGGER.info("Added %d button(s)", added)
 
 
 class PicoMaintenanceResetButton(BaseEntity, ButtonEntity):
@@ -44,6 +45,7 @@ class PicoMaintenanceResetButton(BaseEntity, ButtonEntity):
     _attr_translation_key = "reset_filter_maintenance"
     _attr_device_class = ButtonDeviceClass.RESTART
     _attr_icon = "mdi:gesture-tap-button"
+    _status_fields = frozenset({"man"})
 
     def __init__(self, coordinator: MainCoordinator, device_index: int):
         """Initialize the button."""
@@ -72,15 +74,15 @@ class PicoMaintenanceResetButton(BaseEntity, ButtonEntity):
                 self.coordinator.device_name
             )
 
-            await self.coordinator.client.reset_maintenance(retry=True)
+            result = await self.coordinator.client.reset_maintenance(retry=True)
 
             _LOGGER.info(
                 "[%s] Filter maintenance reset command sent",
                 self.coordinator.device_name
             )
 
-            # Request immediate coordinator refresh to update states
-            await self.coordinator.async_request_refresh()
+            # Update states from the response, or refresh if it carried no status
+            await self.coordinator.async_apply_command_response(result)
 
         except Exception as err:
             _LOGGER.error(
@@ -4,6 +4,72 @@ DOMAIN = "open_pico"
 
 DEFAULT_SCAN_INTERVAL = 5
 
+# Adaptive polling: bounds of the per-device interval (seconds)
+DEFAULT_MIN_SCAN_INTERVAL = 2
+DEFAULT_MAX_SCAN_INTERVAL = 60
+
+# Factor applied to the interval after each poll with unchanged readings
+SCAN_INTERVAL_BACKOFF = 1.5
+
+# Raw status fields whose change counts as activity for the adaptive interval.
+# Sensor readings fluctuate all the time: they only count once they move by
+# more than their publishing deadband (SENSOR_PUBLISH_DEFAULTS)
+ACTIVITY_STATUS_FIELDS = (
+    "on_off", "mod", "spd_row", "spd_rich", "night_mod", "led_on_off", "led_on_off_breve",
+    "s_umd", "s_co2", "m_crono", "tw_active", "err",
+)
+SENSOR_STATUS_FIELDS = {
+    "temperature": "v_tmpr",
+    "humidity": "v_umd",
+    "air_quality": "v_AirQ",
+    "tvoc": "v_Tvoc",
+    "eco2": "v_ECo2",
+}
+
+# Seconds a device is polled at the minimum interval after a user command
+COMMAND_FAST_POLL_DURATION = 30
+
+# Seconds after its last pushed status during which a device counts as pushing
+PUSH_ACTIVE_WINDOW = 600
+
+# Burst polling service: defaults and limits (seconds), samples kept per device
+SERVICE_BURST_POLL = "burst_poll"
+EVENT_BURST_SAMPLE = f"{DOMAIN}_burst_sample"
+DEFAULT_BURST_INTERVAL = 1
+DEFAULT_BURST_DURATION = 120
+MIN_BURST_INTERVAL = 0.5
+MAX_BURST_INTERVAL = 60
+MAX_BURST_DURATION = 3600
+BURST_HISTORY_SIZE = 600
+
+# Setup: devices brought up at once, and per-device time limits (seconds)
+DEFAULT_SETUP_CONCURRENCY = 8
+SETUP_PROBE_TIMEOUT = 5
+
+# Backoff between bring-up attempts of unreachable devices (seconds)
+SETUP_RETRY_MIN_DELAY = 10
+SETUP_RETRY_MAX_DELAY = 300
+
+# Persisted last-known status: storage schema version, debounce of writes (seconds)
+SNAPSHOT_STORAGE_VERSION = 1
+SNAPSHOT_SAVE_DELAY = 30
+
+# Seconds entities keep the last good data after updates start failing
+DEFAULT_STALE_GRACE_PERIOD = 120
+
+# Sensor publishing: deadband per sensor, absolute ("deadband") or in percent of
+# the published value ("deadband_percent"), and the minimum and maximum
+# (heartbeat) seconds between published readings
+SENSOR_PUBLISH_DEFAULTS = {
+    "temperature": {"deadband": 0.2},
+    "humidity": {"deadband": 1.0},
+    "air_quality": {"deadband": 20},
+    "tvoc": {"deadband_percent": 5},
+    "eco2": {"deadband": 20},
+}
+DEFAULT_SENSOR_MIN_PUBLISH_INTERVAL = 0
+DEFAULT_SENSOR_MAX_PUBLISH_INTERVAL = 300
+
 # Device mode mapping - single source of truth
 MODE_INT_TO_PRESET = {
     1: "heat_recovery",
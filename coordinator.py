@@ -1,16 +1,41 @@
 """DataUpdateCoordinator for Open Pico integration."""
 
+from collections import deque
+from collections.abc import Callable, Iterable
 from datetime import timedelta
 import logging
+import time
 
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
+from .open_pico_local_api.enums.command_priority_enum import CommandPriorityEnum
+from .open_pico_local_api.exceptions.command_cancelled_error import CommandCancelledError
+from .open_pico_local_api.exceptions.not_supported_error import NotSupportedError
 from .open_pico_local_api.pico_client import PicoClient
+from .open_pico_local_api.models.command_response_model import CommandResponseModel
 from .open_pico_local_api.models.pico_device_model import PicoDeviceModel
 from .open_pico_local_api.enums.device_mode_enum import DeviceModeEnum
-
-from .const import DEFAULT_SCAN_INTERVAL, DOMAIN
+from .open_pico_local_api.enums.target_humidity_enum import TargetHumidityEnum
+from .open_pico_local_api.utils.constants import VOLATILE_STATUS_FIELDS
+
+from .const import (
+    ACTIVITY_STATUS_FIELDS,
+    BURST_HISTORY_SIZE,
+    COMMAND_FAST_POLL_DURATION,
+    DEFAULT_MAX_SCAN_INTERVAL,
+    DEFAULT_MIN_SCAN_INTERVAL,
+    DEFAULT_SCAN_INTERVAL,
+    DEFAULT_STALE_GRACE_PERIOD,
+    DOMAIN,
+    EVENT_BURST_SAMPLE,
+    PUSH_ACTIVE_WINDOW,
+    SCAN_INTERVAL_BACKOFF,
+    SENSOR_PUBLISH_DEFAULTS,
+    SENSOR_STATUS_FIELDS,
+)
+from .snapshot_store import SnapshotStore
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -24,7 +49,11 @@ class MainCoordinator(DataUpdateCoordinator):
             self,
             hass: HomeAssistant,
             client: PicoClient,
-            device_name: str = None
+            device_name: str = None,
+            min_scan_interval: float = DEFAULT_MIN_SCAN_INTERVAL,
+            max_scan_interval: float = DEFAULT_MAX_SCAN_INTERVAL,
+            stale_grace_period: float = DEFAULT_STALE_GRACE_PERIOD,
+            sensor_publish: dict[str, dict] | None = None,
     ) -> None:
         """Initialize coordinator."""
         self.client = client
@@ -36,21 +65,335 @@ class MainCoordinator(DataUpdateCoordinator):
         self._consecutive_failures = 0
         self._max_failures_before_reset = 3
 
+        # Polls are timed by the FleetPollScheduler, not by the coordinator itself.
+        # The interval adapts: minimum right after a command, back to the default
+        # when readings change, relaxing exponentially while they stay stable.
+        self.min_scan_interval = min_scan_interval
+        self.max_scan_interval = max(max_scan_interval, min_scan_interval)
+        self._poll_interval = timedelta(seconds=self._clamp_interval(DEFAULT_SCAN_INTERVAL))
+        self._fast_poll_until = 0.0
+        self._poll_interval_listener: Callable[[], None] | None = None
+        self._sensor_deadbands = {
+            sensor: {**defaults, **(sensor_publish or {}).get(sensor, {})}
+            for sensor, defaults in SENSOR_PUBLISH_DEFAULTS.items()
+        }
+
+        # Burst polling (burst_poll service): a fixed fast interval for a while,
+        # every sample kept in a ring buffer and fired as an event
+        self._burst_interval: float | None = None
+        self._burst_timer: CALLBACK_TYPE | None = None
+        self.burst_history: deque[dict] = deque(maxlen=BURST_HISTORY_SIZE)
+
+        # Last-known status restored from storage, stale until the first live data
+        self._snapshot_store: SnapshotStore | None = None
+        self._snapshot_saved_at: float | None = None
+
+        # After a failed update the last good data is still served (stale)
+        # for a grace period, before entities turn unavailable
+        self.stale_grace_period = stale_grace_period
+        self._live_at: float | None = None
+        self._failing_since: float | None = None
+        self._grace_timer: CALLBACK_TYPE | None = None
+
+        # Optimistic updates: polls racing a command must not undo its optimistic state
+        self._commands_in_flight = 0
+        self._command_generation = 0
+
+        # Raw status fields that differ from the previously published status,
+        # None when unknown (first data), so entities only write what changed
+        self.changed_fields: frozenset[str] | None = None
+        self._published: PicoDeviceModel | None = None
+
+        # Status frames the device sends on its own are published right away
+        self._last_push: float | None = None
+        client.add_event_callback("*", self._async_handle_push)
+
         super().__init__(
             hass,
             _LOGGER,
             name=f"{DOMAIN} ({self.device_name})",
             update_method=self.async_update_data,
-            update_interval=timedelta(seconds=DEFAULT_SCAN_INTERVAL),
+            update_interval=None,
+        )
+
+    @property
+    def poll_interval(self) -> timedelta:
+        """Return the interval at which the fleet scheduler polls this device."""
+        return self._poll_interval
+
+    @property
+    def is_bursting(self) -> bool:
+        """Return True while a burst poll runs."""
+        return self._burst_interval is not None
+
+    @property
+    def is_restored(self) -> bool:
+        """Return True while the data is a snapshot restored from storage."""
+        return self._snapshot_saved_at is not None
+
+    @property
+    def is_stale(self) -> bool:
+        """Return True while the data is a restored snapshot or the last update failed."""
+        return self.is_restored or not self.last_update_success
+
+    @property
+    def in_grace_period(self) -> bool:
+        """Return True while updates fail for less than the grace period."""
+        if self._failing_since is None:
+            return False
+        return time.monotonic() - self._failing_since < self.stale_grace_period
+
+    @property
+    def is_pushing(self) -> bool:
+        """Return True if the device recently sent its status on its own."""
+        return self._last_push is not None and time.monotonic() - self._last_push < PUSH_ACTIVE_WINDOW
+
+    @property
+    def data_age(self) -> float | None:
+        """Return the age in seconds of the data, read live or restored."""
+        read_at = self._snapshot_saved_at or self._live_at
+        if read_at is None:
+            return None
+        return max(0.0, time.time() - read_at)
+
+    @property
+    def snapshot_age(self) -> float | None:
+        """Return the age in seconds of the restored snapshot, if the data is one."""
+        if self._snapshot_saved_at is None:
+            return None
+        return max(0.0, time.time() - self._snapshot_saved_at)
+
+    @callback
+    def async_restore_snapshot(self, store: SnapshotStore) -> None:
+        """Use the persisted last-known status until the device answers."""
+        self._snapshot_store = store
+
+        snapshot = store.get(self.device_id)
+        if snapshot is None or self.data is not None:
+            return
+
+        self.data, self._snapshot_saved_at = snapshot
+        _LOGGER.debug("[%s] Restored status snapshot (%.0fs old)", self.device_name, self.snapshot_age)
+
+    @callback
+    def _mark_live(self, status: PicoDeviceModel) -> None:
+        """Record fresh data from the device: no longer stale, and persisted."""
+        self._snapshot_saved_at = None
+        self._live_at = time.time()
+        if self._snapshot_store is not None:
+            self._snapshot_store.async_update(self.device_id, status)
+
+    @callback
+    def _async_handle_push(self, frame: dict) -> None:
+        """Publish a status frame the device sent without being asked."""
+        status = CommandResponseModel.from_dict(frame).status
+        if status is None:
+            _LOGGER.debug("[%s] Ignoring pushed frame without status: %s", self.device_name, frame.get("cmd"))
+            return
+
+        if not self.is_pushing:
+            _LOGGER.debug("[%s] Device pushes its status, relaxing polls", self.device_name)
+        self._last_push = time.monotonic()
+
+        self._mark_live(status)
+        self.async_set_updated_data(status)
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Diff the data against the last published status, then notify entities."""
+        self._track_failures()
+        self.changed_fields = self._diff_fields(self._published, self.data)
+        self._published = self.data
+        super().async_update_listeners()
+
+    @callback
+    def _track_failures(self) -> None:
+        """Start the grace period on the first failed update, end it on success."""
+        if self.last_update_success:
+            self._failing_since = None
+            self._cancel_grace_timer()
+            return
+
+        if self._failing_since is not None:
+            return
+
+        self._failing_since = time.monotonic()
+        if self.stale_grace_period > 0:
+            self._grace_timer = async_call_later(self.hass, self.stale_grace_period, self._async_grace_expired)
+        _LOGGER.debug(
+            "[%s] Update failed, serving last data for %ss",
+            self.device_name, self.stale_grace_period
         )
 
+    @callback
+    def _async_grace_expired(self, _now) -> None:
+        """Let entities turn unavailable once the grace period is over."""
+        self._grace_timer = None
+        self.async_update_listeners()
+
+    def _cancel_grace_timer(self) -> None:
+        """Cancel the pending end of the grace period."""
+        if self._grace_timer is not None:
+            self._grace_timer()
+            self._grace_timer = None
+
+    @staticmethod
+    def _diff_fields(previous: PicoDeviceModel | None, status: PicoDeviceModel | None) -> frozenset[str] | None:
+        """Return the raw status fields that differ between two statuses."""
+        if previous is None or status is None:
+            return None
+        if previous is status:
+            return frozenset()
+
+        old, new = previous.raw_data, status.raw_data
+        return frozenset(key for key in old.keys() | new.keys() if old.get(key) != new.get(key))
+
+    def fields_changed(self, fields: Iterable[str] | None) -> bool:
+        """Check if any of the given raw status fields changed in the last update."""
+        if fields is None or self.changed_fields is None:
+            return True
+        return not self.changed_fields.isdisjoint(fields)
+
+    @callback
+    def async_start_burst(self, interval: float, duration: float) -> None:
+        """Poll every interval seconds for duration seconds, then adapt again."""
+        if self._burst_timer is not None:
+            self._burst_timer()
+
+        self._burst_interval = interval
+        self._burst_timer = async_call_later(self.hass, duration, self._async_end_burst)
+        _LOGGER.info("[%s] Burst polling every %.1fs for %.0fs", self.device_name, interval, duration)
+        self._set_poll_interval(interval)
+
+    @callback
+    def _async_end_burst(self, _now) -> None:
+        """Go back to the adaptive poll interval."""
+        self._burst_timer = None
+        self._burst_interval = None
+        _LOGGER.info("[%s] Burst polling finished", self.device_name)
+        self._set_poll_interval(self._clamp_interval(DEFAULT_SCAN_INTERVAL))
+
+    @callback
+    def _record_burst_sample(self, status: PicoDeviceModel) -> None:
+        """Keep a burst poll sample and fire the fields that changed since the previous one."""
+        sample = {"timestamp": time.time(), "status": self._stable_view(status)}
+        previous = self.burst_history[-1]["status"] if self.burst_history else {}
+        self.burst_history.append(sample)
+
+        self.hass.bus.async_fire(
+            EVENT_BURST_SAMPLE,
+            {
+                "device_id": self.device_id,
+                "timestamp": sample["timestamp"],
+                "changed": {key: value for key, value in sample["status"].items() if previous.get(key) != value},
+            },
+        )
+
+    def set_poll_interval_listener(self, listener: Callable[[], None] | None) -> None:
+        """Register the callback told when the poll interval shrinks."""
+        self._poll_interval_listener = listener
+
+    def _clamp_interval(self, seconds: float) -> float:
+        """Keep an interval within the configured bounds."""
+        return max(self.min_scan_interval, min(self.max_scan_interval, seconds))
+
+    def _set_poll_interval(self, seconds: float) -> None:
+        """Change the poll interval, waking the scheduler if it got shorter."""
+        previous = self._poll_interval
+        self._poll_interval = timedelta(seconds=seconds)
+
+        if self._poll_interval != previous:
+            _LOGGER.debug(
+                "[%s] Poll interval %.1fs -> %.1fs",
+                self.device_name, previous.total_seconds(), seconds
+            )
+        if self._poll_interval < previous and self._poll_interval_listener:
+            self._poll_interval_listener()
+
+    def _adapt_poll_interval(self, previous: PicoDeviceModel | None, status: PicoDeviceModel) -> None:
+        """Pick the next poll interval from the latest readings."""
+        if self.is_bursting:
+            self._set_poll_interval(self._burst_interval)
+            return
+
+        if time.monotonic() < self._fast_poll_until:
+            self._set_poll_interval(self.min_scan_interval)
+            return
+
+        # Devices that push their changes are only polled as a safety net
+        pushing = self.is_pushing
+
+        changed = previous is None or self._is_active(previous, status)
+        if changed and not pushing:
+            self._set_poll_interval(self._clamp_interval(DEFAULT_SCAN_INTERVAL))
+            return
+
+        # Stable readings: relax, up to the maximum when off or pushing and half of it when on
+        ceiling = self.max_scan_interval
+        if status.is_on and not pushing:
+            ceiling = max(self.max_scan_interval / 2, DEFAULT_SCAN_INTERVAL)
+        relaxed = self._poll_interval.total_seconds() * SCAN_INTERVAL_BACKOFF
+        self._set_poll_interval(self._clamp_interval(min(relaxed, ceiling)))
+
+    def _boost_poll_interval(self) -> None:
+        """Poll at the minimum interval for a while after a user command."""
+        self._fast_poll_until = time.monotonic() + COMMAND_FAST_POLL_DURATION
+        if not self.is_bursting:
+            self._set_poll_interval(self.min_scan_interval)
+
+    def _is_active(self, previous: PicoDeviceModel, status: PicoDeviceModel) -> bool:
+        """Check if a state field changed, or a reading moved past its sensor deadband."""
+        if any(previous.raw_data.get(key) != status.raw_data.get(key) for key in ACTIVITY_STATUS_FIELDS):
+            return True
+
+        for sensor, key in SENSOR_STATUS_FIELDS.items():
+            before, after = previous.raw_data.get(key), status.raw_data.get(key)
+            if before == after:
+                continue
+            if not isinstance(before, (int, float)) or not isinstance(after, (int, float)):
+                return True
+
+            deadband = self._sensor_deadbands[sensor]
+            threshold = max(deadband.get("deadband", 0.0), abs(before) * deadband.get("deadband_percent", 0.0) / 100)
+            if abs(after - before) >= threshold:
+                return True
+
+        return False
+
+    @staticmethod
+    def _stable_view(status: PicoDeviceModel) -> dict:
+        """Status fields that matter for change detection."""
+        return {key: value for key, value in status.raw_data.items() if key not in VOLATILE_STATUS_FIELDS}
+
+    async def async_probe(self) -> PicoDeviceModel:
+        """
+        Fetch and publish the first status while bringing the device up.
+
+        A single interactive attempt, so unreachable devices fail fast and the
+        probe is never held back by the fleet's congestion window; its answer
+        is the initial data, no second status request is needed.
+        """
+        generation = self._command_generation
+        status = await self.client.get_status(retry=False, priority=CommandPriorityEnum.INTERACTIVE)
+        if status is None:
+            raise UpdateFailed("Device returned no status data")
+
+        # A command sent meanwhile makes this status older than the optimistic data
+        if self.data is not None and (self._commands_in_flight or generation != self._command_generation):
+            _LOGGER.debug("[%s] Probe raced a command, keeping optimistic data", self.device_name)
+            return self.data
+
+        self._adapt_poll_interval(None if self.is_restored else self.data, status)
+        self._mark_live(status)
+        self.async_set_updated_data(status)
+        return status
+
     async def async_update_data(self) -> PicoDeviceModel:
         """
         Fetch data from device.
 
-        This is called independently by Home Assistant's coordinator
-        for each device at the specified update_interval.
-        No coordination with other devices is needed!
+        Called by the FleetPollScheduler in this device's poll slot, and by
+        Home Assistant for the initial and requested refreshes.
         """
         try:
             _LOGGER.debug("[%s] Starting data update", self.device_name)
@@ -65,11 +408,29 @@ class MainCoordinator(DataUpdateCoordinator):
                     raise UpdateFailed(f"Failed to reconnect: {conn_err}") from conn_err
 
             # Get device status (independent API call)
-            status = await self.client.get_status(retry=True)
+            generation = self._command_generation
+            try:
+                status = await self.client.get_status(retry=True)
+            except CommandCancelledError:
+                # A user command is pending and triggers its own refresh
+                if self.data is None:
+                    raise UpdateFailed("Status poll cancelled by a pending command")
+                _LOGGER.debug("[%s] Poll skipped, a command is pending", self.device_name)
+                return self.data
+
+            # A command sent meanwhile makes this status older than the optimistic data
+            if self.data is not None and (self._commands_in_flight or generation != self._command_generation):
+                _LOGGER.debug("[%s] Poll raced a command, keeping optimistic data", self.device_name)
+                return self.data
 
             if status is None:
                 raise UpdateFailed("Device returned no status data")
 
+            self._adapt_poll_interval(None if self.is_restored else self.data, status)
+            self._mark_live(status)
+            if self.is_bursting:
+                self._record_burst_sample(status)
+
             _LOGGER.debug(
                 "[%s] Status: ON=%s, Mode=%s, Temp=%.1f°C, Humidity=%.1f%%, Speed=%d%%",
                 self.device_name,
@@ -95,6 +456,11 @@ class MainCoordinator(DataUpdateCoordinator):
     async def async_shutdown(self) -> None:
         """Shutdown the coordinator."""
         _LOGGER.debug("[%s] Shutting down coordinator", self.device_name)
+        self._cancel_grace_timer()
+        if self._burst_timer is not None:
+            self._burst_timer()
+            self._burst_timer = None
+        self.client.remove_event_callback("*")
         # Client disconnect is handled by PicoClientManager
         pass
 
@@ -150,56 +516,122 @@ class MainCoordinator(DataUpdateCoordinator):
         return self.data.support_target_humidity_selection if self.data else False
 
     # Control methods - these trigger immediate actions followed by refresh
+    async def async_apply_state(
+            self,
+            *,
+            on: bool | None = None,
+            mode: DeviceModeEnum | int | None = None,
+            speed: int | None = None,
+            night: bool | None = None,
+            led: bool | None = None,
+            humidity: TargetHumidityEnum | int | None = None,
+    ) -> None:
+        """Apply several settings with a single command."""
+        _LOGGER.debug(
+            "[%s] Applying state: on=%s, mode=%s, speed=%s, night=%s, led=%s, humidity=%s",
+            self.device_name, on, mode, speed, night, led, humidity
+        )
+
+        # Validate against the mode the device will be in, using cached data
+        target_mode = DeviceModeEnum(int(mode)) if mode is not None else self.current_mode
+        try:
+            PicoClient.validate_state(target_mode, speed=speed, night=night, humidity=humidity)
+        except NotSupportedError as err:
+            raise ValueError(f"Device does not support this setting in mode ({target_mode}): {err}") from err
+
+        self._boost_poll_interval()
+
+        # Show the intended state right away, the device's answer reconciles it
+        fields = PicoClient.build_state_fields(on=on, mode=mode, speed=speed, night=night, led=led, humidity=humidity)
+        previous = self.data
+        optimistic = self._optimistic_status(fields)
+        if optimistic is not None:
+            self._async_publish_optimistic(optimistic)
+
+        self._commands_in_flight += 1
+        self._command_generation += 1
+        try:
+            result = await self.client.apply_state(
+                on=on,
+                mode=mode,
+                speed=speed,
+                night=night,
+                led=led,
+                humidity=humidity,
+                retry=True,
+                force=True,
+            )
+        except Exception:
+            # Roll back, unless newer data arrived in the meantime
+            if optimistic is not None and self.data is optimistic:
+                _LOGGER.debug("[%s] Command failed, rolling back optimistic state", self.device_name)
+                self._async_publish_optimistic(previous)
+            raise
+        finally:
+            self._commands_in_flight -= 1
+
+        await self.async_apply_command_response(result)
+
+    @callback
+    def _async_publish_optimistic(self, data: PicoDeviceModel | None) -> None:
+        """Show data not read from the device, leaving the update failure state alone."""
+        self.data = data
+        self.async_update_listeners()
+
+    def _optimistic_status(self, fields: dict) -> PicoDeviceModel | None:
+        """Return a copy of the current status with command fields applied."""
+        if self.data is None or not fields:
+            return None
+
+        # "speed" is a control flag in a command, the requested speed is reported as spd_rich
+        frame = dict(self.data.raw_data)
+        frame.update({key: value for key, value in fields.items() if key != "speed"})
+        if "spd_row" in fields:
+            frame["spd_rich"] = fields["spd_row"]
+
+        return PicoDeviceModel.from_dict(frame)
+
+    async def async_apply_command_response(self, result: CommandResponseModel) -> None:
+        """Publish the status carried by a command response, or refresh."""
+        if result.status is not None:
+            _LOGGER.debug("[%s] Command response carried status, skipping refresh", self.device_name)
+            self._mark_live(result.status)
+            self.async_set_updated_data(result.status)
+            return
+
+        await self.async_request_refresh()
+
     async def async_turn_on(self) -> None:
         """Turn the device on."""
         _LOGGER.debug("[%s] Turning ON", self.device_name)
-        await self.client.turn_on(retry=True)
-        await self.async_request_refresh()
+        await self.async_apply_state(on=True)
 
     async def async_turn_off(self) -> None:
         """Turn the device off."""
         _LOGGER.debug("[%s] Turning OFF", self.device_name)
-        await self.client.turn_off(retry=True)
-        await self.async_request_refresh()
+        await self.async_apply_state(on=False)
 
     async def async_set_mode(self, mode: DeviceModeEnum | int) -> None:
         """Set operating mode."""
         _LOGGER.debug("[%s] Setting mode to %s", self.device_name, mode)
-        await self.client.change_operating_mode(mode, retry=True)
-        await self.async_request_refresh()
+        await self.async_apply_state(on=True, mode=mode)
 
     async def async_set_fan_speed(self, percentage: int) -> None:
         """Set fan speed percentage."""
         _LOGGER.debug("[%s] Setting fan speed to %d%%", self.device_name, percentage)
-
-        if not self.supports_fan_speed and percentage != 100:
-            raise ValueError(f"Device does not support fan speed control in current mode ({self.current_mode})")
-
-        await self.client.change_fan_speed(percentage, retry=True, force=False)
-        await self.async_request_refresh()
+        await self.async_apply_state(speed=percentage)
 
     async def async_set_night_mode(self, enable: bool) -> None:
         """Set night mode."""
         _LOGGER.debug("[%s] Setting night mode to %s", self.device_name, enable)
-
-        if not self.supports_night_mode:
-            raise ValueError(f"Device does not support night mode in current mode ({self.current_mode})")
-
-        await self.client.set_night_mode(enable, retry=True, force=False)
-        await self.async_request_refresh()
+        await self.async_apply_state(night=enable)
 
     async def async_set_led_status(self, enable: bool) -> None:
         """Set LED status."""
         _LOGGER.debug("[%s] Setting LED to %s", self.device_name, "ON" if enable else "OFF")
-        await self.client.set_led_status(enable, retry=True)
-        await self.async_request_refresh()
+        await self.async_apply_state(led=enable)
 
     async def async_set_target_humidity(self, target: int) -> None:
         """Set target humidity."""
         _LOGGER.debug("[%s] Setting target humidity to %d", self.device_name, target)
-
-        if not self.supports_target_humidity:
-            raise ValueError(f"Device does not support target humidity in current mode ({self.current_mode})")
-
-        await self.client.set_target_humidity(target, retry=True, force=False)
-        await self.async_request_refresh()
\ No newline at end of file
+        await self.async_apply_state(humidity=target)
@@ -47,6 +47,7 @@ class PicoFan(BaseEntity, FanEntity):
     )
 
     _attr_translation_key = "pico"
+    _status_fields = frozenset({"on_off", "mod", "spd_rich", "night_mod"})
 
     def __init__(self, coordinator: MainCoordinator, device_index: int):
         """Initialize the fan."""
@@ -108,10 +109,6 @@ class PicoFan(BaseEntity, FanEntity):
             await self.async_turn_off()
             return
 
-        # Turn on the device if it's currently off
-        if not self.is_on:
-            await self.async_turn_on()
-
         # Check if current mode supports fan speed control
         if not self.coordinator.supports_fan_speed and percentage != 100:
             current_mode = self.preset_mode
@@ -125,9 +122,12 @@ class PicoFan(BaseEntity, FanEntity):
                 "Cannot set fan speed while night mode is enabled"
             )
 
-        # Set the fan speed
+        # Set the fan speed, turning the device on in the same command if needed
         try:
-            await self.coordinator.async_set_fan_speed(percentage)
+            await self.coordinator.async_apply_state(
+                on=True if not self.is_on else None,
+                speed=percentage,
+            )
         except Exception as err:
             _LOGGER.error("Failed to set fan speed: %s", err)
             raise HomeAssistantError(f"Failed to set fan speed: {err}") from err
@@ -145,7 +145,7 @@ class PicoFan(BaseEntity, FanEntity):
         try:
             # Convert int to DeviceModeEnum
             mode_enum = DeviceModeEnum(mode_int)
-            await self.coordinator.async_set_mode(mode_enum)
+            await self.coordinator.async_apply_state(on=True, mode=mode_enum)
         except Exception as err:
             _LOGGER.error("Failed to set preset mode: %s", err)
             raise HomeAssistantError(f"Failed to set preset mode: {err}") from err
@@ -157,17 +157,23 @@ class PicoFan(BaseEntity, FanEntity):
         **kwargs
     ) -> None:
         """Turn on the fan."""
-        try:
-            await self.coordinator.async_turn_on()
+        mode_enum = None
+        if preset_mode and preset_mode in self.preset_modes:
+            mode_enum = DeviceModeEnum(MODE_PRESET_TO_INT[preset_mode])
 
-            # If a preset mode is specified, set it after turning on
-            if preset_mode and preset_mode in self.preset_modes:
-                await self.async_set_preset_mode(preset_mode)
-
-            # If a percentage is specified, set it after turning on
-            if percentage is not None and percentage > 0:
-                await self.async_set_percentage(percentage)
+        speed = percentage if percentage is not None and percentage > 0 else None
+        if speed is not None and self.coordinator.night_mode_enabled:
+            raise HomeAssistantError(
+                "Cannot set fan speed while night mode is enabled"
+            )
 
+        # Power, preset and speed all travel in a single command
+        try:
+            await self.coordinator.async_apply_state(
+                on=True,
+                mode=mode_enum,
+                speed=speed,
+            )
         except Exception as err:
             _LOGGER.error("Failed to turn on fan: %s", err)
             raise HomeAssistantError(f"Failed to turn on fan: {err}") from err
@@ -0,0 +1,321 @@
+"""
+Command-line fleet poller and benchmarking tool
+
+Runs the same code path as the Home Assistant integration (shared transport,
+protocol core, scheduler, PicoFleet) from a shell.
+
+Usage:
+    python -m open_pico_local_api status 192.168.1.100 192.168.1.101:4321 --pin 1234
+    python -m open_pico_local_api watch 192.168.1.100 --interval 2 --fields v_tmpr v_umd
+    python -m open_pico_local_api bench 192.168.1.100 192.168.1.101 --count 50
+    python -m open_pico_local_api sync 192.168.1.100
+
+Devices are given as IP or IP:PIN; --pin is used when no PIN is attached.
+"""
+
+import os
+import sys
+
+# Run from the Home Assistant integration directory, the platform modules
+# living next to this package (select.py) would shadow the standard library
+_PACKAGE_PARENT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path[:] = [p for p in sys.path if os.path.abspath(p or os.curdir) != _PACKAGE_PARENT] + [_PACKAGE_PARENT]
+
+import argparse
+import asyncio
+import json
+import logging
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from .models.pico_device_model import PicoDeviceModel
+from .pico_client import PicoClient
+from .pico_fleet import PicoFleet
+from .shared_transport_manager import SharedTransportManager
+
+
+def _parse_target(target: str, default_pin: Optional[str]) -> Tuple[str, str]:
+    """Split an IP[:PIN] argument"""
+    ip, _, pin = target.partition(":")
+    pin = pin or default_pin
+    if not pin:
+        raise argparse.ArgumentTypeError(f"No PIN for {ip}: use IP:PIN or --pin")
+    return ip, pin
+
+
+def _percentile(samples: List[float], percent: float) -> Optional[float]:
+    """Nearest-rank percentile of a list of samples"""
+    if not samples:
+        return None
+    ordered = sorted(samples)
+    rank = max(0, min(len(ordered) - 1, round(percent / 100 * len(ordered) + 0.5) - 1))
+    return ordered[rank]
+
+
+def _ms(seconds: Optional[float]) -> str:
+    """Format seconds as milliseconds"""
+    return "-" if seconds is None else f"{seconds * 1000:.1f}ms"
+
+
+def _emit(record: Dict[str, Any]) -> None:
+    """Write one NDJSON line"""
+    print(json.dumps(record, default=str), flush=True)
+
+
+def _status_record(device_id: str, status: PicoDeviceModel) -> Dict[str, Any]:
+    """Flatten a status snapshot for JSON output"""
+    return {
+        "ts": time.time(),
+        "device_id": device_id,
+        "on": status.is_on,
+        "mode": status.operating.mode.name,
+        "temperature": status.sensors.temperature_celsius,
+        "humidity": status.sensors.humidity_percent,
+        "raw": status.raw_data,
+    }
+
+
+class PicoCli:
+    """Shared transport, clients and fleet for one CLI run"""
+
+    def __init__(self, args: argparse.Namespace):
+        self.args = args
+        self.clients: Dict[str, PicoClient] = {}
+        self.fleet = PicoFleet(self.clients, concurrency=args.concurrency)
+        self.transport_manager: Optional[SharedTransportManager] = None
+
+    async def __aenter__(self):
+        self.transport_manager = await SharedTransportManager.get_instance()
+        await self.transport_manager.initialize(
+            local_port=self.args.local_port,
+            verbose=self.args.verbose,
+            max_packets_per_second=self.args.max_pps,
+            device_packets_per_second=self.args.device_pps,
+            congestion_control=not self.args.no_congestion_control
+        )
+
+        for target in self.args.devices:
+            ip, pin = _parse_target(target, self.args.pin)
+            client = PicoClient(
+                ip=ip,
+                pin=pin,
+                device_port=self.args.device_port,
+                local_port=self.args.local_port,
+                retry_attempts=self.args.retry_attempts,
+                verbose=self.args.verbose,
+                status_max_age=0
+            )
+            self.clients[client.device_id] = client
+
+        for result in (await self.fleet.connect_all()).values():
+            if not result.ok:
+                print(f"✗ {result.device_id}: {result.error}", file=sys.stderr)
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.fleet.disconnect_all()
+        if self.transport_manager:
+            await self.transport_manager.shutdown()
+        return False
+
+    @property
+    def connected_ids(self) -> List[str]:
+        """Devices whose client connected"""
+        return [device_id for device_id, client in self.clients.items() if client.connected]
+
+    # ----------------------------
+    # SUBCOMMANDS
+    # ----------------------------
+
+    async def status(self) -> int:
+        """One-shot status of every device, in parallel"""
+        failures = 0
+        async for result in self.fleet.stream_status(self.connected_ids, retry=not self.args.no_retry):
+            if not result.ok:
+                failures += 1
+                if self.args.json:
+                    _emit({"ts": time.time(), "device_id": result.device_id, "error": str(result.error)})
+                else:
+                    print(f"✗ {result.device_id}: {result.error} ({_ms(result.elapsed)})")
+                continue
+
+            if self.args.json:
+                _emit({**_status_record(result.device_id, result.value), "elapsed": result.elapsed})
+            else:
+                status = result.value
+                print(
+                    f"✓ {result.device_id}: {'on' if status.is_on else 'off'}, mode={status.operating.mode.name}, "
+                    f"{status.sensors.temperature_celsius}°C, {status.sensors.humidity_percent}% "
+                    f"({_ms(result.elapsed)})"
+                )
+
+        return 1 if failures or len(self.connected_ids) < len(self.clients) else 0
+
+    async def watch(self) -> int:
+        """
+        Stream status snapshots of every device as NDJSON
+
+        Watches never end, so they all run side by side instead of going
+        through the fleet, whose concurrency limit would leave the devices
+        past it unwatched.
+        """
+
+        async def _watch(client: PicoClient) -> bool:
+            try:
+                async for status in client.watch(
+                        interval=self.args.interval,
+                        only_changes=not self.args.all,
+                        fields=self.args.fields
+                ):
+                    _emit(_status_record(client.device_id, status))
+            except Exception as e:
+                _emit({"ts": time.time(), "device_id": client.device_id, "error": str(e)})
+                return False
+            return True
+
+        results = await asyncio.gather(*(_watch(self.clients[device_id]) for device_id in self.connected_ids))
+        return 0 if all(results) else 1
+
+    async def bench(self) -> int:
+        """Sequential status reads per device, devices in parallel"""
+        count = self.args.count
+
+        async def _bench(client: PicoClient) -> Dict[str, Any]:
+            rtts = []
+            attempts = client.metrics.request_attempts
+            timeouts = client.metrics.request_timeouts
+            started = time.monotonic()
+            for _ in range(count):
+                sent = time.monotonic()
+                try:
+                    await client.get_status(retry=False)
+                except Exception:
+                    continue
+                rtts.append(time.monotonic() - sent)
+            return {
+                "rtts": rtts,
+                "attempts": client.metrics.request_attempts - attempts,
+                "timeouts": client.metrics.request_timeouts - timeouts,
+                "elapsed": time.monotonic() - started,
+            }
+
+        started = time.monotonic()
+        results = await self.fleet.run(_bench, self.connected_ids)
+        elapsed = time.monotonic() - started
+
+        total = {"rtts": [], "attempts": 0, "timeouts": 0, "elapsed": elapsed}
+        for device_id in sorted(results):
+            result = results[device_id]
+            if not result.ok:
+                print(f"✗ {device_id}: {result.error}")
+                continue
+            for key in ("rtts", "attempts", "timeouts"):
+                total[key] += result.value[key]
+            print(self._bench_line(device_id, count, **result.value))
+
+        requested = count * len(results)
+        print(self._bench_line("TOTAL", requested, **total))
+
+        diagnostics = self.transport_manager.congestion_diagnostics if self.transport_manager else None
+        if diagnostics:
+            print(
+                f"  congestion window {diagnostics['window']}, srtt {_ms(diagnostics['srtt'])}, "
+                f"min rtt {_ms(diagnostics['min_rtt'])}, timeouts {diagnostics['timeouts']}"
+            )
+        return 0 if len(total["rtts"]) == requested else 1
+
+    async def sync(self) -> int:
+        """Force an IDP resync: reset the counter, then read the status"""
+
+        async def _sync(client: PicoClient) -> PicoDeviceModel:
+            await client.reset_idp()
+            return await client.get_status()
+
+        failures = 0
+        async for result in self.fleet.stream(_sync, self.connected_ids):
+            if result.ok:
+                print(f"✓ {result.device_id}: IDP synchronized (idp {result.value.idp}, {_ms(result.elapsed)})")
+            else:
+                failures += 1
+                print(f"✗ {result.device_id}: {result.error}")
+        return 1 if failures else 0
+
+    @staticmethod
+    def _bench_line(label: str, requested: int, rtts: List[float], attempts: int, timeouts: int,
+                    elapsed: float) -> str:
+        """Format one row of benchmark results"""
+        loss = timeouts / attempts if attempts else 0.0
+        throughput = len(rtts) / elapsed if elapsed > 0 else 0.0
+        return (
+            f"{label}: {len(rtts)}/{requested} ok, {attempts} datagrams, loss {loss:.1%}, "
+            f"p50 {_ms(_percentile(rtts, 50))}, p90 {_ms(_percentile(rtts, 90))}, "
+            f"p99 {_ms(_percentile(rtts, 99))}, max {_ms(max(rtts) if rtts else None)}, "
+            f"{throughput:.1f} req/s"
+        )
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Create the argument parser"""
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument("devices", nargs="+", metavar="IP[:PIN]", help="Devices to talk to")
+    common.add_argument("--pin", help="PIN for devices given without one")
+    common.add_argument("--local-port", type=int, default=40069, help="Local UDP port (default: 40069)")
+    common.add_argument("--device-port", type=int, default=40070, help="Device UDP port (default: 40070)")
+    common.add_argument("--concurrency", type=int, default=8, help="Devices worked on at once (default: 8)")
+    common.add_argument("--retry-attempts", type=int, default=3, help="Retries per request (default: 3)")
+    common.add_argument("--max-pps", type=float, default=100.0, help="Socket send budget, 0 disables (default: 100)")
+    common.add_argument("--device-pps", type=float, default=10.0, help="Per-device send budget, 0 disables (default: 10)")
+    common.add_argument("--no-congestion-control", action="store_true", help="Disable the AIMD request window")
+    common.add_argument("-v", "--verbose", action="store_true", help="Enable verbose logging")
+
+    parser = argparse.ArgumentParser(prog="python -m open_pico_local_api", description=__doc__.split("\n\n")[0].strip())
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    status = subparsers.add_parser("status", parents=[common], help="Read the status of every device once")
+    status.add_argument("--json", action="store_true", help="Print NDJSON instead of text")
+    status.add_argument("--no-retry", action="store_true", help="Single attempt per device")
+
+    watch = subparsers.add_parser("watch", parents=[common], help="Stream status snapshots as NDJSON")
+    watch.add_argument("--interval", type=float, default=5.0, help="Seconds between polls (default: 5)")
+    watch.add_argument("--fields", nargs="+", help="Raw status fields compared to detect changes")
+    watch.add_argument("--all", action="store_true", help="Emit every snapshot, not only changes")
+
+    bench = subparsers.add_parser("bench", parents=[common], help="Measure RTT, loss and throughput")
+    bench.add_argument("--count", type=int, default=20, help="Status reads per device (default: 20)")
+
+    subparsers.add_parser("sync", parents=[common], help="Force an IDP resync on every device")
+
+    return parser
+
+
+async def run(args: argparse.Namespace) -> int:
+    """Run a parsed command line"""
+    async with PicoCli(args) as cli:
+        return await getattr(cli, args.command)()
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Entry point of `python -m open_pico_local_api`"""
+    parser = build_parser()
+    args = parser.parse_args(argv)
+
+    for target in args.devices:
+        try:
+            _parse_target(target, args.pin)
+        except argparse.ArgumentTypeError as e:
+            parser.error(str(e))
+
+    logging.basicConfig(level=logging.DEBUG if args.verbose else logging.WARNING)
+
+    try:
+        return asyncio.run(run(args))
+    except KeyboardInterrupt:
+        return 130
+    except BrokenPipeError:
+        # Output piped into a command that exited early (e.g. head)
+        sys.stderr.close()
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
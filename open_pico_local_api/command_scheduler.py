@@ -0,0 +1,160 @@
+"""
+Per-device command scheduler
+
+Orders the commands a PicoClient sends to its device: interactive commands
+first, then validation pre-checks, then periodic polls. At most
+`max_in_flight` commands are handed to the protocol core at once, and polls
+waiting behind an interactive command are dropped since the command is
+always followed by a fresh status read anyway.
+
+Commands sharing a coalesce key are latest-wins: a newer command replaces
+an older one of the same kind still waiting at the tail of its lane, and
+the callers of both are resolved with the result of the single frame that
+is eventually sent. A command queued behind it is never overtaken.
+"""
+
+import asyncio
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Callable, Deque, Dict, List, Optional
+
+from .enums.command_priority_enum import CommandPriorityEnum
+
+
+@dataclass(eq=False)
+class ScheduledCommand:
+    """A command waiting for, or occupying, an in-flight slot"""
+    cmd: Dict[str, Any]
+    retry: bool
+    priority: CommandPriorityEnum
+    futures: List[asyncio.Future] = field(default_factory=list)
+    request_id: Optional[int] = None  # Protocol core request ID once dispatched
+    coalesce_key: Optional[str] = None  # Commands of the same kind supersede each other
+    holds_slot: bool = False  # Occupies a slot of the transport's congestion window
+
+
+class CommandScheduler:
+    """Priority lanes plus an in-flight window for a single device"""
+
+    def __init__(self, max_in_flight: int = 1):
+        if max_in_flight < 1:
+            raise ValueError("max_in_flight must be at least 1")
+
+        self.max_in_flight = max_in_flight
+        self._lanes: Dict[CommandPriorityEnum, Deque[ScheduledCommand]] = {
+            priority: deque() for priority in CommandPriorityEnum
+        }
+        self._in_flight: List[ScheduledCommand] = []
+
+    @property
+    def queued_count(self) -> int:
+        """Number of commands waiting for an in-flight slot"""
+        return sum(len(lane) for lane in self._lanes.values())
+
+    @property
+    def in_flight_count(self) -> int:
+        """Number of commands currently handed to the protocol core"""
+        return len(self._in_flight)
+
+    @property
+    def has_pending_interactive(self) -> bool:
+        """Check if an interactive command is queued or in flight"""
+        return bool(self._lanes[CommandPriorityEnum.INTERACTIVE]) or any(
+            c.priority == CommandPriorityEnum.INTERACTIVE for c in self._in_flight
+        )
+
+    def enqueue(self, command: ScheduledCommand) -> List[ScheduledCommand]:
+        """
+        Queue a command in its priority lane
+
+        Returns:
+            Poll commands dropped because an interactive command is pending
+            (possibly including the command just enqueued)
+        """
+        if command.priority == CommandPriorityEnum.POLL and self.has_pending_interactive:
+            return [command]
+
+        self._lanes[command.priority].append(command)
+
+        if command.priority == CommandPriorityEnum.INTERACTIVE:
+            return self.cancel_queued(CommandPriorityEnum.POLL)
+        return []
+
+    def coalesce(self, command: ScheduledCommand) -> Optional[ScheduledCommand]:
+        """
+        Fold a command into the last queued command if it is of the same kind
+
+        Only the tail of the lane is considered: merging into an earlier
+        command would move the new payload ahead of the commands queued
+        in between (e.g. "mode 2", "off", "mode 3" must not end off).
+
+        Returns:
+            The queued command now carrying the new payload and callers,
+            or None if nothing was queued with the same coalesce key
+        """
+        if command.coalesce_key is None:
+            return None
+
+        lane = self._lanes[command.priority]
+        if not lane or lane[-1].coalesce_key != command.coalesce_key:
+            return None
+
+        queued = lane[-1]
+        queued.cmd = command.cmd
+        queued.retry = queued.retry or command.retry
+        queued.futures.extend(command.futures)
+        command.futures = []
+        return queued
+
+    def next_ready(
+            self,
+            admit: Optional[Callable[[ScheduledCommand], bool]] = None
+    ) -> Optional[ScheduledCommand]:
+        """
+        Pop the highest-priority command if an in-flight slot is free
+
+        Args:
+            admit: Extra gate consulted before popping (e.g. a fleet-wide
+                congestion window); a refusal leaves the command queued
+        """
+        if len(self._in_flight) >= self.max_in_flight:
+            return None
+
+        for priority in sorted(self._lanes):
+            lane = self._lanes[priority]
+            if lane:
+                if admit is not None and not admit(lane[0]):
+                    return None
+                command = lane.popleft()
+                self._in_flight.append(command)
+                return command
+
+        return None
+
+    def complete(self, command: ScheduledCommand) -> None:
+        """Release the in-flight slot held by a command"""
+        if command in self._in_flight:
+            self._in_flight.remove(command)
+
+    def remove(self, command: ScheduledCommand) -> bool:
+        """Drop a command that is still queued"""
+        lane = self._lanes[command.priority]
+        if command in lane:
+            lane.remove(command)
+            return True
+        return False
+
+    def cancel_queued(self, priority: CommandPriorityEnum) -> List[ScheduledCommand]:
+        """Drop every queued command in a lane, returning them"""
+        lane = self._lanes[priority]
+        cancelled = list(lane)
+        lane.clear()
+        return cancelled
+
+    def drain(self) -> List[ScheduledCommand]:
+        """Drop every queued and in-flight command, returning them"""
+        drained = list(self._in_flight)
+        self._in_flight.clear()
+        for priority in self._lanes:
+            drained.extend(self.cancel_queued(priority))
+        return drained
@@ -0,0 +1,8 @@
+from enum import IntEnum
+
+
+class CommandPriorityEnum(IntEnum):
+    """Scheduling lanes for device commands (lower values are sent first)"""
+    INTERACTIVE = 1
+    PRECHECK = 2
+    POLL = 3
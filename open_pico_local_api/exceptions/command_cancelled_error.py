@@ -0,0 +1,6 @@
+from .pico_device_error import PicoDeviceError
+
+
+class CommandCancelledError(PicoDeviceError):
+    """Raised when a queued command is dropped before reaching the device"""
+    pass
@@ -0,0 +1,25 @@
+from dataclasses import dataclass
+
+
+@dataclass
+class ClientMetricsModel:
+    """Counters describing the requests issued by a PicoClient"""
+    status_requests: int = 0  # get_status() calls
+    status_singleflight_hits: int = 0  # Calls that joined an in-flight stato_sync
+    status_singleflight_misses: int = 0  # Calls that sent their own stato_sync
+    request_attempts: int = 0  # Request datagrams sent for completed requests, IDP resyncs included
+    request_timeouts: int = 0  # Attempts that got no response in time
+
+    @property
+    def status_singleflight_hit_ratio(self) -> float:
+        """Share of status calls served by an in-flight request"""
+        if self.status_requests == 0:
+            return 0.0
+        return self.status_singleflight_hits / self.status_requests
+
+    @property
+    def request_loss_ratio(self) -> float:
+        """Share of request attempts that timed out"""
+        if self.request_attempts == 0:
+            return 0.0
+        return self.request_timeouts / self.request_attempts
@@ -1,5 +1,8 @@
 from dataclasses import dataclass
-from typing import Any, Dict
+from typing import Any, Dict, Optional
+
+from .pico_device_model import PicoDeviceModel
+from ..utils.constants import STATUS_FRAME_FIELDS
 
 
 @dataclass
@@ -8,11 +11,22 @@ class CommandResponseModel:
     idp: int
     firmware: str
     command: str
+    status: Optional[PicoDeviceModel] = None  # Decoded when the response carries status fields
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'CommandResponseModel':
+        status = None
+        if all(field in data for field in STATUS_FRAME_FIELDS):
+            status = PicoDeviceModel.from_dict(data)
+
         return cls(
             idp=data.get("idp", 0),
             firmware=data.get("frm", ""),
             command=data.get("cmd", ""),
-        )
\ No newline at end of file
+            status=status,
+        )
+
+    @property
+    def has_status(self) -> bool:
+        """Check if the response carried the device status"""
+        return self.status is not None
@@ -0,0 +1,16 @@
+from dataclasses import dataclass
+from typing import Any, Optional
+
+
+@dataclass
+class FleetResultModel:
+    """Outcome of a fleet-wide operation on a single device"""
+    device_id: str
+    value: Any = None
+    error: Optional[BaseException] = None
+    elapsed: float = 0.0  # Seconds spent on this device, excluding queueing
+
+    @property
+    def ok(self) -> bool:
+        """Check if the operation succeeded on this device"""
+        return self.error is None
@@ -4,22 +4,44 @@ Modified PicoClient that uses shared transport for multiple devices
 
 import logging
 import asyncio
-import json
 import time
-from typing import Optional, Dict, Any, Union
+from typing import Optional, Dict, Any, Union, AsyncIterator, Callable, Iterable
 
+from .command_scheduler import CommandScheduler, ScheduledCommand
+from .enums.command_priority_enum import CommandPriorityEnum
 from .enums.device_mode_enum import DeviceModeEnum
 from .enums.target_humidity_enum import TargetHumidityEnum
+from .exceptions.command_cancelled_error import CommandCancelledError
 from .exceptions.not_supported_error import NotSupportedError
 from .exceptions.pico_device_error import PicoDeviceError
+from .models.client_metrics_model import ClientMetricsModel
 from .models.command_response_model import CommandResponseModel
 from .models.pico_device_model import PicoDeviceModel
+from .pico_protocol_core import OutgoingDatagram, PicoProtocolCore
 from .shared_transport_manager import SharedTransportManager
-from .utils.constants import HUMIDITY_SELECTOR_PRESET_MODES, MODULAR_FAN_SPEED_PRESET_MODES
+from .utils.constants import (
+    HUMIDITY_SELECTOR_PRESET_MODES,
+    MODULAR_FAN_SPEED_PRESET_MODES,
+    PUSH_FRAME_COMMANDS,
+    VOLATILE_STATUS_FIELDS,
+)
 
 _LOGGER = logging.getLogger(__name__)
 __version__ = "2.1.0"
 
+# Fields shared by every upd_pico frame that say nothing about what it changes
+_ENVELOPE_FIELDS = ("cmd", "frm", "pin", "idp")
+
+# Writing any of these fields makes the cached status useless for validation
+_STATUS_INVALIDATING_FIELDS = ("mod", "man_reset")
+
+
+def _coalesce_key(cmd: Dict[str, Any]) -> str:
+    """Commands writing the same set of fields supersede each other"""
+    fields = sorted(k for k in cmd if k not in _ENVELOPE_FIELDS)
+    return f"{cmd.get('cmd', '')}:{','.join(fields)}"
+
+
 class PicoClient:
     """
     Pico device client using shared UDP transport.
@@ -39,7 +61,9 @@ class PicoClient:
             retry_attempts: int = 3,
             retry_delay: float = 2.0,
             verbose: bool = False,
-            use_shared_transport: bool = True
+            use_shared_transport: bool = True,
+            max_in_flight: int = 1,
+            status_max_age: float = 10.0
     ):
         self.ip = ip
         self.pin = pin
@@ -50,6 +74,7 @@ class PicoClient:
         self.retry_delay = retry_delay
         self.verbose = verbose
         self.use_shared_transport = use_shared_transport
+        self.status_max_age = status_max_age
 
         # Generate device_id if not provided
         self.device_id = device_id or f"{ip}:{device_port}"
@@ -58,12 +83,34 @@ class PicoClient:
         self._transport_manager = None
 
         # IDP management
-        self._idp_counter = 1
         self._idp_range_start = 1
         self._idp_range_size = 10000
 
+        # Protocol state machine, driven by _run_driver() while connected
+        self._core = PicoProtocolCore(
+            idp_range_start=self._idp_range_start,
+            idp_range_size=self._idp_range_size,
+            retry_attempts=retry_attempts,
+            retry_delay=retry_delay,
+            device_id=self.device_id,
+            verbose=verbose
+        )
+        self._driver_task: Optional[asyncio.Task] = None
+
+        # Orders commands into priority lanes and bounds the in-flight window
+        self._scheduler = CommandScheduler(max_in_flight=max_in_flight)
+        self._in_flight: Dict[int, ScheduledCommand] = {}
+
+        # Last decoded status, reused by command pre-checks while fresh
+        self._last_status: Optional[PicoDeviceModel] = None
+        self._last_status_time: Optional[float] = None
+
+        # Shared stato_sync request joined by concurrent get_status() callers
+        self._status_inflight: Optional[asyncio.Future] = None
+        self._status_waiters: Dict[asyncio.Future, int] = {}  # Callers awaiting each shared request
+        self.metrics = ClientMetricsModel()
+
         self._response_queue = asyncio.Queue()
-        self._lock = asyncio.Lock()
         self._connected = False
         self._event_callbacks = {}
 
@@ -82,6 +129,36 @@ class PicoClient:
         """Check if device is connected"""
         return self._connected
 
+    @property
+    def last_status(self) -> Optional[PicoDeviceModel]:
+        """Last status received from the device, if any"""
+        return self._last_status
+
+    @property
+    def last_status_age(self) -> Optional[float]:
+        """Seconds since the last status was received, or None"""
+        if self._last_status_time is None:
+            return None
+        return time.monotonic() - self._last_status_time
+
+    def add_event_callback(self, cmd: str, callback: Callable[[Dict[str, Any]], Any]) -> None:
+        """
+        Call a function with every frame of a given cmd the device sends on its own
+
+        Args:
+            cmd: Frame cmd to listen to, or "*" for unsolicited frames of any cmd
+            callback: Function or coroutine function receiving the raw frame
+        """
+        self._event_callbacks[cmd] = callback
+
+    def remove_event_callback(self, cmd: str) -> None:
+        """Stop listening to the frames of a cmd"""
+        self._event_callbacks.pop(cmd, None)
+
+    def invalidate_status_cache(self) -> None:
+        """Force the next pre-check to read a fresh status from the device"""
+        self._last_status_time = None
+
     async def reset_idp(self) -> None:
         """
         Manually reset IDP counter to start of range.
@@ -89,7 +166,7 @@ class PicoClient:
         Useful when device communication is stuck due to IDP mismatch.
         This can happen if the device was restarted or lost power.
         """
-        await self._reset_idp_counter()
+        self._core.reset_idp()
         if self.verbose:
             _LOGGER.debug(f"✓ [{self.device_id}] IDP counter manually reset")
 
@@ -125,7 +202,7 @@ class PicoClient:
                 )
 
                 # Reset IDP counter to start of range
-                self._idp_counter = self._idp_range_start
+                self._core.set_idp_range(self._idp_range_start, self._idp_range_size)
 
                 if self.verbose:
                     _LOGGER.debug(f"✓ Connected '{self.device_id}' to {self.ip}:{self.device_port} (shared transport)")
@@ -135,6 +212,7 @@ class PicoClient:
                 # Legacy mode: dedicated socket (not recommended for multiple devices)
                 raise NotImplementedError("Legacy mode not implemented in this version. Use shared transport.")
 
+            self._driver_task = asyncio.create_task(self._run_driver())
             self._connected = True
 
         except Exception as e:
@@ -150,6 +228,26 @@ class PicoClient:
 
         self._connected = False
 
+        if self._driver_task:
+            self._driver_task.cancel()
+            try:
+                await self._driver_task
+            except asyncio.CancelledError:
+                pass
+            self._driver_task = None
+
+        # Fail whatever was still waiting for the device
+        self._core.cancel_all()
+        for command in self._in_flight.values():
+            self._release_request_slot(command)
+        self._in_flight.clear()
+        for command in self._scheduler.drain():
+            self._fail_command(command, ConnectionError("Disconnected from device"))
+
+        # The shared status request now fails with the error above, but only once
+        # its task runs again: never let a caller of the next connection join it
+        self._status_inflight = None
+
         if self.verbose:
             _LOGGER.debug(f"✓ Disconnected '{self.device_id}'")
 
@@ -157,25 +255,92 @@ class PicoClient:
     # PUBLIC API METHODS
     # ----------------------------
 
-    async def get_status(self, retry: bool = True) -> PicoDeviceModel:
-        """Get device status"""
+    async def get_status(
+            self,
+            retry: bool = True,
+            priority: CommandPriorityEnum = CommandPriorityEnum.POLL
+    ) -> PicoDeviceModel:
+        """
+        Get device status
+
+        Periodic polls use the default POLL priority and are dropped with
+        CommandCancelledError if an interactive command is pending. Callers
+        arriving while a status request is in flight share its result.
+        """
         if not self._connected:
             raise ConnectionError("Not connected to device")
 
-        cmd = {
-            "cmd": "stato_sync",
-            "frm": "app",
-            "pin": self.pin
-        }
+        response = await self._get_status_frame(retry, priority)
+        return self._decode_status(response)
 
-        response = await self._execute_command_with_retry(cmd, retry)
-        if not response:
-            raise TimeoutError("Failed to get device status")
+    async def watch(
+            self,
+            interval: float = 5.0,
+            only_changes: bool = True,
+            fields: Optional[Iterable[str]] = None,
+            retry: bool = True
+    ) -> AsyncIterator[PicoDeviceModel]:
+        """
+        Stream device status snapshots
+
+        Polls run in the background on the POLL lane every `interval` seconds.
+        A consumer slower than the poll rate always receives the latest
+        snapshot rather than a backlog. With only_changes, frames are compared
+        before parsing and only yielded when they differ from the last one
+        yielded; `fields` restricts the comparison to those raw status keys.
+
+        Example:
+            >>> async for status in client.watch(interval=2, fields=["v_tmpr", "mod"]):
+            ...     print(status.sensors.temperature, status.operating.mode)
+        """
+        if not self._connected:
+            raise ConnectionError("Not connected to device")
+
+        watched_fields = tuple(fields) if fields is not None else None
+        latest: Dict[str, Any] = {}
+        updated = asyncio.Event()
+
+        async def _poll() -> None:
+            loop = asyncio.get_running_loop()
+            next_poll = loop.time()
+            while True:
+                try:
+                    latest["frame"] = await self._get_status_frame(retry, CommandPriorityEnum.POLL)
+                    updated.set()
+                except (CommandCancelledError, TimeoutError) as e:
+                    if self.verbose:
+                        _LOGGER.debug(f"⚠ [{self.device_id}] Watch poll skipped: {e}")
+                except Exception as e:
+                    latest["error"] = e
+                    updated.set()
+                    return
+
+                next_poll = max(next_poll + interval, loop.time())
+                await asyncio.sleep(next_poll - loop.time())
 
+        poller = asyncio.create_task(_poll())
+        last_signature = None
         try:
-            return PicoDeviceModel.from_dict(response)
-        except Exception as e:
-            raise PicoDeviceError(f"Failed to parse device status: {e}")
+            while True:
+                await updated.wait()
+                updated.clear()
+
+                if "error" in latest:
+                    raise latest.pop("error")
+
+                frame = latest.pop("frame", None)
+                if frame is None:
+                    continue
+
+                if only_changes:
+                    signature = self._frame_signature(frame, watched_fields)
+                    if signature == last_signature:
+                        continue
+                    last_signature = signature
+
+                yield self._decode_status(frame)
+        finally:
+            poller.cancel()
 
     async def turn_on(self, retry: bool = True) -> CommandResponseModel:
         """Turn the device on"""
@@ -200,8 +365,8 @@ class PicoClient:
             "pin": self.pin
         }
 
-        result = await self._execute_command_with_retry(cmd, retry)
-        return CommandResponseModel.from_dict(result)
+        result = await self._execute_command_with_retry(cmd, retry, coalesce_key=_coalesce_key(cmd))
+        return self._command_response(result)
 
     async def change_fan_speed(self, percentage: int, retry: bool = True, force=False) -> CommandResponseModel:
         """Change the fan speed"""
@@ -209,7 +374,7 @@ class PicoClient:
             raise ConnectionError("Not connected to device")
 
         if not force:
-            current_status = await self.get_status(retry=retry)
+            current_status = await self._get_status_for_validation(retry)
             if current_status.operating.mode not in MODULAR_FAN_SPEED_PRESET_MODES and percentage != 100:
                 raise NotSupportedError(
                     f"Current mode {current_status.operating.mode} does not support fan speed control! {percentage}")
@@ -222,8 +387,8 @@ class PicoClient:
             "pin": self.pin
         }
 
-        result = await self._execute_command_with_retry(cmd, retry)
-        return CommandResponseModel.from_dict(result)
+        result = await self._execute_command_with_retry(cmd, retry, coalesce_key=_coalesce_key(cmd))
+        return self._command_response(result)
 
     async def set_night_mode(self, enable: bool, retry: bool = True, force=False) -> CommandResponseModel:
         """Set night mode"""
@@ -231,7 +396,7 @@ class PicoClient:
             raise ConnectionError("Not connected to device")
 
         if not force:
-            current_status = await self.get_status(retry=retry)
+            current_status = await self._get_status_for_validation(retry)
             if current_status.operating.mode not in MODULAR_FAN_SPEED_PRESET_MODES:
                 raise NotSupportedError(f"Current mode {current_status.operating.mode} does not support night mode!")
 
@@ -242,8 +407,8 @@ class PicoClient:
             "pin": self.pin
         }
 
-        result = await self._execute_command_with_retry(cmd, retry)
-        return CommandResponseModel.from_dict(result)
+        result = await self._execute_command_with_retry(cmd, retry, coalesce_key=_coalesce_key(cmd))
+        return self._command_response(result)
 
     async def set_led_status(self, enable: bool, retry: bool = True) -> CommandResponseModel:
         """Set LED status"""
@@ -257,8 +422,8 @@ class PicoClient:
             "pin": self.pin
         }
 
-        result = await self._execute_command_with_retry(cmd, retry)
-        return CommandResponseModel.from_dict(result)
+        result = await self._execute_command_with_retry(cmd, retry, coalesce_key=_coalesce_key(cmd))
+        return self._command_response(result)
 
     async def set_target_humidity(self, target_humidity: TargetHumidityEnum, retry: bool = True,
                                   force=False) -> CommandResponseModel:
@@ -267,7 +432,7 @@ class PicoClient:
             raise ConnectionError("Not connected to device")
 
         if not force:
-            current_status = await self.get_status(retry=retry)
+            current_status = await self._get_status_for_validation(retry)
             if current_status.operating.mode not in HUMIDITY_SELECTOR_PRESET_MODES:
                 raise NotSupportedError(
                     f"Current mode {current_status.operating.mode} does not support target humidity selection!")
@@ -279,8 +444,94 @@ class PicoClient:
             "pin": self.pin
         }
 
-        result = await self._execute_command_with_retry(cmd, retry)
-        return CommandResponseModel.from_dict(result)
+        result = await self._execute_command_with_retry(cmd, retry, coalesce_key=_coalesce_key(cmd))
+        return self._command_response(result)
+
+    async def apply_state(
+            self,
+            on: Optional[bool] = None,
+            mode: Optional[Union[DeviceModeEnum, int]] = None,
+            speed: Optional[int] = None,
+            night: Optional[bool] = None,
+            led: Optional[bool] = None,
+            humidity: Optional[Union[TargetHumidityEnum, int]] = None,
+            retry: bool = True,
+            force=False
+    ) -> CommandResponseModel:
+        """
+        Apply several settings with a single upd_pico frame
+
+        Only the arguments that are not None are sent. Speed, night mode and
+        target humidity are validated against the requested mode, or the
+        device's current mode when no mode is given, unless force is set.
+        """
+        if not self._connected:
+            raise ConnectionError("Not connected to device")
+
+        fields = self.build_state_fields(on, mode, speed, night, led, humidity)
+        if not fields:
+            raise ValueError("apply_state() needs at least one setting")
+
+        if not force and (speed is not None or night is not None or humidity is not None):
+            if mode is not None:
+                target_mode = DeviceModeEnum(int(mode))
+            else:
+                current_status = await self._get_status_for_validation(retry)
+                target_mode = current_status.operating.mode
+            self.validate_state(target_mode, speed=speed, night=night, humidity=humidity)
+
+        cmd = {
+            **fields,
+            "cmd": "upd_pico",
+            "frm": "app",
+            "pin": self.pin
+        }
+
+        result = await self._execute_command_with_retry(cmd, retry, coalesce_key=_coalesce_key(cmd))
+        return self._command_response(result)
+
+    @staticmethod
+    def build_state_fields(
+            on: Optional[bool] = None,
+            mode: Optional[Union[DeviceModeEnum, int]] = None,
+            speed: Optional[int] = None,
+            night: Optional[bool] = None,
+            led: Optional[bool] = None,
+            humidity: Optional[Union[TargetHumidityEnum, int]] = None
+    ) -> Dict[str, Any]:
+        """Map settings to the upd_pico fields that carry them"""
+        fields = {}
+        if on is not None:
+            fields["on_off"] = 1 if on else 2
+        if mode is not None:
+            fields["mod"] = int(mode)
+        if speed is not None:
+            fields["spd_row"] = speed
+            fields["speed"] = 0
+        if night is not None:
+            fields["night_mod"] = 1 if night else 2
+        if led is not None:
+            fields["led_on_off_breve"] = 1 if led else 2
+        if humidity is not None:
+            fields["s_umd"] = int(humidity)
+        return fields
+
+    @staticmethod
+    def validate_state(
+            mode: Optional[DeviceModeEnum],
+            speed: Optional[int] = None,
+            night: Optional[bool] = None,
+            humidity: Optional[Union[TargetHumidityEnum, int]] = None
+    ) -> None:
+        """Raise NotSupportedError if a setting is not available in the given mode"""
+        if speed is not None and speed != 100 and mode not in MODULAR_FAN_SPEED_PRESET_MODES:
+            raise NotSupportedError(f"Mode {mode} does not support fan speed control! {speed}")
+
+        if night is not None and mode not in MODULAR_FAN_SPEED_PRESET_MODES:
+            raise NotSupportedError(f"Mode {mode} does not support night mode!")
+
+        if humidity is not None and mode not in HUMIDITY_SELECTOR_PRESET_MODES:
+            raise NotSupportedError(f"Mode {mode} does not support target humidity selection!")
 
     async def reset_maintenance(self, retry: bool = True) -> CommandResponseModel:
         """
@@ -293,7 +544,7 @@ class PicoClient:
             raise ConnectionError("Not connected to device")
 
         # Get current status to get existing maintenance array
-        current_status = await self.get_status(retry=retry)
+        current_status = await self._get_status_for_validation(retry)
         man_status = current_status.device_info.maintenance
 
         # If maintenance status is not available, we cannot proceed with reset
@@ -319,143 +570,356 @@ class PicoClient:
         }
 
         result = await self._execute_command_with_retry(cmd, retry)
-        return CommandResponseModel.from_dict(result)
+        return self._command_response(result)
 
     # ----------------------------
     # INTERNAL METHODS
     # ----------------------------
 
-    async def _get_next_idp(self) -> int:
-        """Get next IDP within allocated range"""
-        async with self._lock:
-            idp = self._idp_counter
-            self._idp_counter += 1
-
-            # Wrap around within allocated range
-            if self._idp_counter >= (self._idp_range_start + self._idp_range_size):
-                self._idp_counter = self._idp_range_start
+    @staticmethod
+    def _frame_signature(frame: Dict[str, Any], fields: Optional[tuple] = None) -> Dict[str, Any]:
+        """Comparable view of the status fields a watcher cares about"""
+        if fields is not None:
+            return {key: frame.get(key) for key in fields}
+        return {key: value for key, value in frame.items() if key not in VOLATILE_STATUS_FIELDS}
 
-            return idp
+    async def _get_status_frame(self, retry: bool, priority: CommandPriorityEnum) -> Dict[str, Any]:
+        """Fetch the raw status frame, joining a request already in flight"""
+        self.metrics.status_requests += 1
 
-    async def _reset_idp_counter(self) -> None:
-        """Reset IDP counter to start of allocated range"""
-        async with self._lock:
-            old_counter = self._idp_counter
-            self._idp_counter = self._idp_range_start
-            if self.verbose:
-                _LOGGER.debug(f"  ✓ [{self.device_id}] IDP counter reset: {old_counter} → {self._idp_counter}")
+        inflight = self._status_inflight
+        if inflight is not None and not inflight.done():
+            self.metrics.status_singleflight_hits += 1
+            try:
+                return await self._join_status_inflight(inflight)
+            except CommandCancelledError:
+                if priority == CommandPriorityEnum.POLL:
+                    raise
+                # The shared request was a poll dropped for a command, ours must go through
+                return await self._fetch_status_frame(retry, priority)
+
+        self.metrics.status_singleflight_misses += 1
+        inflight = asyncio.ensure_future(self._fetch_status_frame(retry, priority))
+        self._status_inflight = inflight
+        inflight.add_done_callback(self._clear_status_inflight)
+        return await self._join_status_inflight(inflight)
+
+    async def _join_status_inflight(self, inflight: asyncio.Future) -> Dict[str, Any]:
+        """
+        Wait for a shared status request
 
-    async def _send_udp_packet(self, cmd: Dict[str, Any]) -> bool:
-        """Send a raw UDP packet to the device"""
+        A caller giving up does not cancel the request for the others, but the
+        last one to give up cancels it, freeing its lane and congestion slot.
+        """
+        self._status_waiters[inflight] = self._status_waiters.get(inflight, 0) + 1
         try:
-            data = json.dumps(cmd).encode('utf-8')
+            return await asyncio.shield(inflight)
+        except asyncio.CancelledError:
+            if self._status_waiters[inflight] == 1 and not inflight.done():
+                if self.verbose:
+                    _LOGGER.debug(f"✗ [{self.device_id}] Every caller gave up, cancelling shared status request")
+                inflight.cancel()
+            raise
+        finally:
+            self._status_waiters[inflight] -= 1
+            if not self._status_waiters[inflight]:
+                del self._status_waiters[inflight]
+
+    def _clear_status_inflight(self, future: asyncio.Future) -> None:
+        """Forget the shared status request once it completes"""
+        if self._status_inflight is future:
+            self._status_inflight = None
+        # Mark the error as retrieved in case every caller stopped waiting
+        if not future.cancelled():
+            future.exception()
+
+    async def _fetch_status_frame(self, retry: bool, priority: CommandPriorityEnum) -> Dict[str, Any]:
+        """Send a stato_sync and return the raw response"""
+        cmd = {
+            "cmd": "stato_sync",
+            "frm": "app",
+            "pin": self.pin
+        }
 
-            if self.use_shared_transport:
-                await self._transport_manager.send_to_device(self.device_id, data)
-            else:
-                raise NotImplementedError("Legacy mode not supported")
+        response = await self._execute_command_with_retry(cmd, retry, priority)
+        if not response:
+            raise TimeoutError("Failed to get device status")
 
-            if self.verbose:
-                cmd_name = cmd.get('cmd', 'ACK' if cmd.get('res') == 99 else 'unknown')
-                _LOGGER.debug(f"→ [{self.device_id}] SENT: {cmd_name} (idp:{cmd['idp']})")
+        return response
 
-            return True
+    def _decode_status(self, response: Dict[str, Any]) -> PicoDeviceModel:
+        """Parse a status frame once and remember it for pre-checks"""
+        if self._last_status is not None and self._last_status.raw_data is response:
+            return self._last_status
 
+        try:
+            status = PicoDeviceModel.from_dict(response)
         except Exception as e:
+            raise PicoDeviceError(f"Failed to parse device status: {e}")
+
+        self._remember_status(status)
+        return status
+
+    def _remember_status(self, status: PicoDeviceModel) -> None:
+        """Store a freshly received status for pre-checks"""
+        self._last_status = status
+        self._last_status_time = time.monotonic()
+
+    def _command_response(self, response: Optional[Dict[str, Any]]) -> CommandResponseModel:
+        """Decode a command response, keeping any status it carries"""
+        if not response:
+            raise TimeoutError("No response from device to command")
+
+        result = CommandResponseModel.from_dict(response)
+        if result.status is not None:
+            self._remember_status(result.status)
+        return result
+
+    async def _get_status_for_validation(self, retry: bool = True) -> PicoDeviceModel:
+        """Return the cached status if fresher than status_max_age, else fetch it"""
+        age = self.last_status_age
+        if age is not None and age <= self.status_max_age:
             if self.verbose:
-                _LOGGER.debug(f"✗ [{self.device_id}] Send error: {e}")
-            raise
+                _LOGGER.debug(f"  ✓ [{self.device_id}] Using cached status for validation ({age:.1f}s old)")
+            return self._last_status
+
+        return await self.get_status(retry=retry, priority=CommandPriorityEnum.PRECHECK)
 
     async def _execute_command_with_retry(
             self,
             cmd_dict: Dict[str, Any],
-            retry: bool = True
+            retry: bool = True,
+            priority: CommandPriorityEnum = CommandPriorityEnum.INTERACTIVE,
+            coalesce_key: Optional[str] = None
     ) -> Optional[Dict[str, Any]]:
-        """Execute a command with IDP sync retry logic"""
-        max_attempts = self.retry_attempts if retry else 1
-        max_idp_sync = 5
+        """
+        Schedule a command and wait for the device response
 
-        for attempt in range(1, max_attempts + 1):
-            if attempt > 1:
+        Commands with a coalesce_key replace the last queued command if it has
+        the same key, so only the latest value of a burst is sent.
+        """
+        future = asyncio.get_running_loop().create_future()
+        command = ScheduledCommand(
+            cmd=cmd_dict,
+            retry=retry,
+            priority=priority,
+            futures=[future],
+            coalesce_key=coalesce_key
+        )
+
+        superseded = self._scheduler.coalesce(command)
+        if superseded is not None:
+            if self.verbose:
+                _LOGGER.debug(f"↺ [{self.device_id}] Coalesced queued '{coalesce_key}' command")
+            command = superseded
+        else:
+            for cancelled in self._scheduler.enqueue(command):
                 if self.verbose:
-                    _LOGGER.debug(f"↻ [{self.device_id}] Retry {attempt}/{max_attempts}")
-                await asyncio.sleep(self.retry_delay)
-
-            for idp_sync_attempt in range(max_idp_sync):
-                if idp_sync_attempt > 0 and self.verbose:
-                    _LOGGER.debug(f"  ↻ [{self.device_id}] IDP sync attempt {idp_sync_attempt}/{max_idp_sync}")
+                    _LOGGER.debug(f"✗ [{self.device_id}] Dropping queued poll behind pending command")
+                self._fail_command(cancelled, CommandCancelledError("Poll superseded by a pending command"))
 
-                idp = await self._get_next_idp()
-                cmd = {**cmd_dict, "idp": idp}
+        self._dispatch_ready()
+        self._wake_driver()
 
-                if not await self._send_udp_packet(cmd):
-                    continue
+        try:
+            response = await future
+        except asyncio.CancelledError:
+            self._abandon_command(command, future)
+            raise
 
-                response_timeout = 2.0
-                response = await self._wait_for_response(idp, response_timeout)
+        if response and any(field in cmd_dict for field in _STATUS_INVALIDATING_FIELDS):
+            self.invalidate_status_cache()
 
-                if response:
-                    if idp_sync_attempt > 0 and self.verbose:
-                        _LOGGER.debug(f"  ✓ [{self.device_id}] IDP synchronized after {idp_sync_attempt} increments")
-                    return response
+        return response
 
-                # If no response after 3 seconds, IDP is likely out of sync
-                if self.verbose:
-                    _LOGGER.debug(f"  ⚠ [{self.device_id}] No response for IDP {idp} - likely out of sync")
+    def _dispatch_ready(self) -> None:
+        """Hand queued commands to the protocol core while the window allows"""
+        while (command := self._scheduler.next_ready(admit=self._acquire_request_slot)) is not None:
+            command.request_id = self._core.submit(command.cmd, time.monotonic(), retry=command.retry)
+            self._in_flight[command.request_id] = command
 
-            # After all IDP sync attempts failed, reset IDP counter
-            if attempt < max_attempts:
-                if self.verbose:
-                    _LOGGER.debug(f"  ⟲ [{self.device_id}] Resetting IDP counter to range start")
-                await self._reset_idp_counter()
-
-        return None
+    def _acquire_request_slot(self, command: ScheduledCommand) -> bool:
+        """Ask the shared transport's congestion window for room to send a command"""
+        if not self._transport_manager:
+            return True
+        command.holds_slot = self._transport_manager.try_acquire_request_slot(
+            self.device_id,
+            priority=command.priority == CommandPriorityEnum.INTERACTIVE
+        )
+        return command.holds_slot
 
-    async def _wait_for_response(self, idp: int, timeout: float) -> Optional[Dict[str, Any]]:
-        """Wait for responses matching the given idp"""
-        got_ack = False
-        end_time = time.time() + timeout
-        ack_timeout = 2.0
-        ack_received_time = None
+    def _release_request_slot(
+            self,
+            command: ScheduledCommand,
+            rtt: Optional[float] = None,
+            timed_out: bool = False
+    ) -> None:
+        """Give a command's congestion window slot back, reporting how its request went"""
+        if not command.holds_slot:
+            return
+        command.holds_slot = False
+        if self._transport_manager:
+            self._transport_manager.release_request_slot(rtt=rtt, timed_out=timed_out)
+
+    def _abandon_command(self, command: ScheduledCommand, future: asyncio.Future) -> None:
+        """Forget a caller that stopped waiting, and the command if it was the last one"""
+        if future in command.futures:
+            command.futures.remove(future)
+        if command.futures:
+            return
 
-        while time.time() < end_time:
-            remaining = end_time - time.time()
-            if remaining <= 0:
-                break
+        if not self._scheduler.remove(command) and command.request_id is not None:
+            # Caller gave up, stop retrying on its behalf
+            self._core.cancel(command.request_id)
+            self._in_flight.pop(command.request_id, None)
+            self._scheduler.complete(command)
+            self._release_request_slot(command)
+            self._dispatch_ready()
+            self._wake_driver()
+
+    def _resolve_command(self, command: ScheduledCommand, response: Optional[Dict[str, Any]]) -> None:
+        """Deliver a response to every caller waiting on a command"""
+        for future in command.futures:
+            if not future.done():
+                future.set_result(response)
+
+    def _fail_command(self, command: ScheduledCommand, error: Exception) -> None:
+        """Deliver an error to every caller waiting on a command"""
+        for future in command.futures:
+            if not future.done():
+                future.set_exception(error)
+
+    def _wake_driver(self) -> None:
+        """Make the driver flush new datagrams and recompute its deadline"""
+        self._response_queue.put_nowait(None)
+
+    async def _run_driver(self) -> None:
+        """Pump the protocol core: send its datagrams, feed it frames and time"""
+        while True:
+            try:
+                await self._flush_core()
+
+                deadline = self._core.next_deadline()
+                timeout = None if deadline is None else max(0.0, deadline - time.monotonic())
+
+                try:
+                    item = await asyncio.wait_for(self._response_queue.get(), timeout=timeout)
+                except asyncio.TimeoutError:
+                    item = None
+
+                now = time.monotonic()
+                while True:
+                    if item is not None:
+                        response, addr = item
+                        if not self._core.receive_frame(response, now):
+                            self._dispatch_unmatched_frame(response)
+                    if self._response_queue.empty():
+                        break
+                    item = self._response_queue.get_nowait()
+
+                self._core.tick(now)
+
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                _LOGGER.error(f"✗ [{self.device_id}] Protocol driver error: {e}")
+
+    def _dispatch_unmatched_frame(self, frame: Dict[str, Any]) -> None:
+        """
+        Hand a frame in our IDP range that answers no pending request to the "*" callback
 
-            if got_ack and ack_received_time:
-                if time.time() - ack_received_time > ack_timeout:
-                    if self.verbose:
-                        _LOGGER.debug(f"  ⚠ [{self.device_id}] ACK received but no status - IDP may be out of sync")
-                    return None
+        A status the device pushes on its own may carry an IDP that falls in our
+        range; the transport already called the callback of its exact cmd.
+        """
+        cmd = frame.get("cmd")
+        if frame.get("res") == 99 or cmd not in PUSH_FRAME_COMMANDS or cmd in self._event_callbacks:
+            return
 
-            try:
-                response, addr = await asyncio.wait_for(
-                    self._response_queue.get(),
-                    timeout=min(remaining, 0.5)
-                )
+        callback = self._event_callbacks.get("*")
+        if callback is not None:
+            asyncio.create_task(self._run_event_callback(callback, frame))
 
-                if response.get("idp") != idp:
+    async def _run_event_callback(self, callback: Callable[[Dict[str, Any]], Any], frame: Dict[str, Any]) -> None:
+        """Run an event callback, logging its errors"""
+        try:
+            if asyncio.iscoroutinefunction(callback):
+                await callback(frame)
+            else:
+                callback(frame)
+        except Exception as e:
+            _LOGGER.error(f"✗ [{self.device_id}] Event callback error: {e}")
+
+    async def _flush_core(self) -> None:
+        """Send pending datagrams and resolve completed requests"""
+        while True:
+            self._dispatch_ready()
+            released_slot = False
+
+            for datagram in self._core.data_to_send():
+                try:
+                    await self._send_udp_packet(datagram.data, priority=self._is_priority_datagram(datagram))
+                except Exception as e:
+                    if datagram.is_ack:
+                        continue
+                    self._core.cancel(datagram.request_id)
+                    command = self._in_flight.pop(datagram.request_id, None)
+                    if command:
+                        self._scheduler.complete(command)
+                        self._release_request_slot(command)
+                        self._fail_command(command, e)
+                        released_slot = True
                     continue
 
-                if response.get("res") == 99 and response.get("frm") == "mst":
-                    if self.verbose:
-                        _LOGGER.debug(f"  ✓ [{self.device_id}] ACK received (idp:{idp})")
-                    got_ack = True
-                    ack_received_time = time.time()
-
-                elif response.get("res") != 99:
-                    if self.verbose:
-                        _LOGGER.debug(f"  ✓ [{self.device_id}] Response received (idp:{idp})")
+                if not datagram.is_ack:
+                    self._core.mark_sent(datagram.request_id, datagram.idp, time.monotonic())
 
-                    ack = {"idp": idp, "frm": "app", "res": 99}
-                    await self._send_udp_packet(ack)
-                    return response
+                if self.verbose:
+                    name = "ACK" if datagram.is_ack else "request"
+                    _LOGGER.debug(f"→ [{self.device_id}] SENT: {name} (idp:{datagram.idp})")
+
+            # A request losing its first attempt gives its slot back (shrinking the
+            # window) and retries outside of it, so unreachable devices do not
+            # hold the fleet's window for their whole retry ladder
+            for request_id in self._core.first_timeouts():
+                command = self._in_flight.get(request_id)
+                if command and command.holds_slot:
+                    self._release_request_slot(command, timed_out=True)
+                    released_slot = True
+
+            results = self._core.results()
+            if not results and not released_slot:
+                return
+
+            # Completed commands free in-flight slots, so loop to dispatch more
+            for result in results:
+                # Every sent attempt either timed out or produced the response
+                self.metrics.request_attempts += result.timeouts + (1 if result.succeeded else 0)
+                self.metrics.request_timeouts += result.timeouts
+                command = self._in_flight.pop(result.request_id, None)
+                if command:
+                    self._scheduler.complete(command)
+                    self._release_request_slot(command, rtt=result.rtt, timed_out=result.timeouts > 0)
+                    self._resolve_command(command, result.response)
+
+    def _is_priority_datagram(self, datagram: OutgoingDatagram) -> bool:
+        """ACKs and interactive commands bypass the transport's send pacing"""
+        if datagram.is_ack:
+            return True
+        command = self._in_flight.get(datagram.request_id)
+        return command is not None and command.priority == CommandPriorityEnum.INTERACTIVE
 
-            except asyncio.TimeoutError:
-                continue
+    async def _send_udp_packet(self, data: bytes, priority: bool = False) -> None:
+        """Send a raw UDP packet to the device"""
+        try:
+            if self.use_shared_transport:
+                await self._transport_manager.send_to_device(self.device_id, data, priority=priority)
+            else:
+                raise NotImplementedError("Legacy mode not supported")
 
-        return None
+        except Exception as e:
+            if self.verbose:
+                _LOGGER.debug(f"✗ [{self.device_id}] Send error: {e}")
+            raise
 
     async def _set_on_off(self, turn_on: bool, retry: bool = True) -> CommandResponseModel:
         """Turn the device on or off"""
@@ -469,5 +933,5 @@ class PicoClient:
             "pin": self.pin
         }
 
-        result = await self._execute_command_with_retry(cmd, retry)
-        return CommandResponseModel.from_dict(result)
\ No newline at end of file
+        result = await self._execute_command_with_retry(cmd, retry, coalesce_key=_coalesce_key(cmd))
+        return self._command_response(result)
\ No newline at end of file
@@ -0,0 +1,175 @@
+"""
+Bulk operations across many Pico devices
+
+PicoFleet fans an operation out over a set of PicoClient instances sharing
+the same transport, with a bound on how many devices are worked on at once
+and an optional minimum spacing between operation starts. A failure on one
+device never fails the batch: every device gets its own FleetResultModel.
+"""
+
+import asyncio
+import logging
+import time
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Iterable, List, Mapping, Optional, Tuple
+
+from .models.fleet_result_model import FleetResultModel
+from .pico_client import PicoClient
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class PicoFleet:
+    """
+    Facade running the same operation on many devices.
+
+    Usage:
+        fleet = PicoFleet({"living_room": client1, "bedroom": client2}, concurrency=4)
+
+        results = await fleet.get_status_all()
+        for device_id, result in results.items():
+            print(device_id, result.value if result.ok else result.error)
+
+        async for result in fleet.stream_status():
+            print(result.device_id, result.elapsed)
+    """
+
+    def __init__(
+            self,
+            clients: Mapping[str, PicoClient],
+            concurrency: int = 8,
+            pacing: float = 0.0
+    ):
+        """
+        Args:
+            clients: Clients by device ID (read live, so later additions are included)
+            concurrency: Maximum number of devices worked on at once
+            pacing: Minimum seconds between two operation starts
+        """
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+
+        self._clients = clients
+        self.concurrency = concurrency
+        self.pacing = pacing
+
+    @property
+    def device_ids(self) -> List[str]:
+        """IDs of the devices in the fleet"""
+        return list(self._clients)
+
+    # ----------------------------
+    # GENERIC FAN-OUT
+    # ----------------------------
+
+    async def stream(
+            self,
+            operation: Callable[[PicoClient], Awaitable[Any]],
+            device_ids: Optional[Iterable[str]] = None
+    ) -> AsyncIterator[FleetResultModel]:
+        """
+        Run an operation on every selected device, yielding results as they complete
+
+        Args:
+            operation: Coroutine function called with each PicoClient
+            device_ids: Devices to include (all devices by default)
+        """
+        targets = self._select(device_ids)
+        if not targets:
+            return
+
+        semaphore = asyncio.Semaphore(self.concurrency)
+        pace_lock = asyncio.Lock()
+        last_start = [float("-inf")]
+
+        async def _run(device_id: str, client: PicoClient) -> FleetResultModel:
+            async with semaphore:
+                if self.pacing > 0:
+                    async with pace_lock:
+                        wait = last_start[0] + self.pacing - time.monotonic()
+                        if wait > 0:
+                            await asyncio.sleep(wait)
+                        last_start[0] = time.monotonic()
+
+                started = time.monotonic()
+                try:
+                    value = await operation(client)
+                except Exception as e:
+                    return FleetResultModel(device_id=device_id, error=e, elapsed=time.monotonic() - started)
+                return FleetResultModel(device_id=device_id, value=value, elapsed=time.monotonic() - started)
+
+        tasks = [asyncio.ensure_future(_run(device_id, client)) for device_id, client in targets]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def run(
+            self,
+            operation: Callable[[PicoClient], Awaitable[Any]],
+            device_ids: Optional[Iterable[str]] = None
+    ) -> Dict[str, FleetResultModel]:
+        """Run an operation on every selected device and collect the results"""
+        return {result.device_id: result async for result in self.stream(operation, device_ids)}
+
+    # ----------------------------
+    # BULK API
+    # ----------------------------
+
+    async def connect_all(self, device_ids: Optional[Iterable[str]] = None) -> Dict[str, FleetResultModel]:
+        """Connect every selected device"""
+        return await self.run(lambda client: client.connect(), device_ids)
+
+    async def disconnect_all(self, device_ids: Optional[Iterable[str]] = None) -> Dict[str, FleetResultModel]:
+        """Disconnect every selected device"""
+        return await self.run(lambda client: client.disconnect(), device_ids)
+
+    async def get_status_all(
+            self,
+            device_ids: Optional[Iterable[str]] = None,
+            retry: bool = True
+    ) -> Dict[str, FleetResultModel]:
+        """Read the status of every selected device"""
+        return await self.run(lambda client: client.get_status(retry=retry), device_ids)
+
+    def stream_status(
+            self,
+            device_ids: Optional[Iterable[str]] = None,
+            retry: bool = True
+    ) -> AsyncIterator[FleetResultModel]:
+        """Read the status of every selected device, yielding results as they arrive"""
+        return self.stream(lambda client: client.get_status(retry=retry), device_ids)
+
+    async def apply_all(
+            self,
+            device_ids: Optional[Iterable[str]] = None,
+            retry: bool = True,
+            force: bool = False,
+            **state: Any
+    ) -> Dict[str, FleetResultModel]:
+        """
+        Apply the same settings to every selected device
+
+        Keyword arguments are passed to PicoClient.apply_state(), e.g.
+        `await fleet.apply_all(on=True, speed=40)`.
+        """
+        return await self.run(lambda client: client.apply_state(retry=retry, force=force, **state), device_ids)
+
+    # ----------------------------
+    # INTERNAL METHODS
+    # ----------------------------
+
+    def _select(self, device_ids: Optional[Iterable[str]]) -> List[Tuple[str, PicoClient]]:
+        """Resolve the devices an operation applies to"""
+        if device_ids is None:
+            return list(self._clients.items())
+
+        targets = []
+        for device_id in device_ids:
+            client = self._clients.get(device_id)
+            if client is None:
+                _LOGGER.warning(f"⚠ Unknown device '{device_id}' skipped by fleet operation")
+                continue
+            targets.append((device_id, client))
+        return targets
@@ -0,0 +1,394 @@
+"""
+Sans-IO protocol core for the Pico request/ACK/response exchange
+
+The core owns everything that does not need a socket or an event loop:
+IDP allocation, ACK tracking, response matching and the retry / IDP resync
+ladder. Drivers feed it received frames and the current time, and drain the
+datagrams it wants sent and the requests it has completed.
+
+Typical driver loop:
+    core = PicoProtocolCore(idp_range_start=1, idp_range_size=10000)
+    request_id = core.submit({"cmd": "stato_sync", "frm": "app", "pin": "1234"}, now)
+
+    for datagram in core.data_to_send():
+        sock.sendto(datagram.data, addr)
+
+    core.receive_datagram(data, now)   # for every datagram received
+    core.tick(now)                     # whenever core.next_deadline() expires
+
+    for result in core.results():
+        print(result.request_id, result.response)
+"""
+
+import json
+import logging
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+_LOGGER = logging.getLogger(__name__)
+
+# Number of consecutive IDPs tried before a full retry is scheduled
+DEFAULT_MAX_IDP_SYNC = 5
+
+# Seconds to wait for a response after sending a request
+DEFAULT_RESPONSE_TIMEOUT = 2.0
+
+# Seconds to wait for a response once the device has ACKed the request
+DEFAULT_ACK_TIMEOUT = 2.0
+
+
+@dataclass
+class OutgoingDatagram:
+    """Datagram the core wants the driver to send"""
+    request_id: int
+    idp: int
+    data: bytes
+    is_ack: bool = False
+
+
+@dataclass
+class RequestResult:
+    """Outcome of a submitted request"""
+    request_id: int
+    response: Optional[Dict[str, Any]]  # None when every attempt timed out
+    attempts: int
+    timeouts: int
+    rtt: Optional[float] = None  # Seconds between the last send and its response
+
+    @property
+    def succeeded(self) -> bool:
+        """Check if the device answered the request"""
+        return self.response is not None
+
+
+@dataclass
+class _PendingRequest:
+    """Book-keeping for a request that has not completed yet"""
+    request_id: int
+    cmd: Dict[str, Any]
+    max_attempts: int
+    attempt: int = 1
+    idp_sync_attempt: int = 0
+    idp: Optional[int] = None
+    sent_at: float = 0.0
+    ack_at: Optional[float] = None
+    deadline: float = 0.0
+    waiting_retry: bool = False
+    timeouts: int = 0
+
+
+class PicoProtocolCore:
+    """
+    I/O-free state machine for the Pico request/ACK/response protocol.
+
+    The core never reads a clock, sleeps or touches a socket: every method
+    that depends on time takes `now` (any monotonic clock, in seconds).
+    """
+
+    def __init__(
+            self,
+            idp_range_start: int = 1,
+            idp_range_size: int = 10000,
+            retry_attempts: int = 3,
+            retry_delay: float = 2.0,
+            max_idp_sync: int = DEFAULT_MAX_IDP_SYNC,
+            response_timeout: float = DEFAULT_RESPONSE_TIMEOUT,
+            ack_timeout: float = DEFAULT_ACK_TIMEOUT,
+            device_id: str = "",
+            verbose: bool = False
+    ):
+        self.retry_attempts = retry_attempts
+        self.retry_delay = retry_delay
+        self.max_idp_sync = max_idp_sync
+        self.response_timeout = response_timeout
+        self.ack_timeout = ack_timeout
+        self.device_id = device_id
+        self.verbose = verbose
+
+        self._idp_range_start = idp_range_start
+        self._idp_range_size = idp_range_size
+        self._idp_counter = idp_range_start
+
+        self._next_request_id = 1
+        self._requests: Dict[int, _PendingRequest] = {}
+        self._by_idp: Dict[int, _PendingRequest] = {}
+
+        self._outgoing: List[OutgoingDatagram] = []
+        self._results: List[RequestResult] = []
+        self._first_timeouts: List[int] = []  # Requests whose first attempt just timed out
+
+    # ----------------------------
+    # CONFIGURATION
+    # ----------------------------
+
+    def set_idp_range(self, start: int, size: int) -> None:
+        """
+        Use an IDP range and restart the counter from its start
+
+        Reconnecting with the same range keeps the counter, so the IDPs the
+        device already saw are not reused.
+        """
+        if (start, size) == (self._idp_range_start, self._idp_range_size):
+            return
+        self._idp_range_start = start
+        self._idp_range_size = size
+        self._idp_counter = start
+
+    def reset_idp(self) -> None:
+        """Reset IDP counter to start of allocated range"""
+        old_counter = self._idp_counter
+        self._idp_counter = self._idp_range_start
+        if self.verbose:
+            _LOGGER.debug(f"  ✓ [{self.device_id}] IDP counter reset: {old_counter} → {self._idp_counter}")
+
+    @property
+    def idp_counter(self) -> int:
+        """Next IDP that will be allocated"""
+        return self._idp_counter
+
+    @property
+    def pending_count(self) -> int:
+        """Number of requests that have not completed yet"""
+        return len(self._requests)
+
+    # ----------------------------
+    # INPUTS
+    # ----------------------------
+
+    def submit(self, cmd: Dict[str, Any], now: float, retry: bool = True) -> int:
+        """
+        Queue a command for sending
+
+        Args:
+            cmd: Command payload without the idp field
+            now: Current time
+            retry: Enable the retry ladder (a single attempt otherwise)
+
+        Returns:
+            Request ID used to match the eventual RequestResult
+        """
+        request_id = self._next_request_id
+        self._next_request_id += 1
+
+        request = _PendingRequest(
+            request_id=request_id,
+            cmd=cmd,
+            max_attempts=self.retry_attempts if retry else 1,
+        )
+        self._requests[request_id] = request
+        self._send_attempt(request, now)
+        return request_id
+
+    def mark_sent(self, request_id: int, idp: int, now: float) -> None:
+        """
+        Record when a request's datagram actually left
+
+        The driver may hold datagrams back (send pacing), which must count
+        neither in the RTT nor against the response timeout.
+        """
+        request = self._requests.get(request_id)
+        if request is None or request.idp != idp:
+            return
+        request.sent_at = now
+        request.deadline = now + self.response_timeout
+
+    def cancel(self, request_id: int) -> bool:
+        """Forget a request without producing a result"""
+        request = self._requests.pop(request_id, None)
+        if request is None:
+            return False
+        self._release_idp(request)
+        return True
+
+    def cancel_all(self) -> List[int]:
+        """Forget every pending request, returning their IDs"""
+        request_ids = list(self._requests)
+        self._requests.clear()
+        self._by_idp.clear()
+        return request_ids
+
+    def receive_datagram(self, data: bytes, now: float) -> bool:
+        """
+        Feed a raw datagram received from the device
+
+        Returns:
+            True if the datagram belonged to a pending request
+        """
+        try:
+            frame = json.loads(data.decode('utf-8'))
+        except (UnicodeDecodeError, json.JSONDecodeError) as e:
+            if self.verbose:
+                _LOGGER.debug(f"⚠ [{self.device_id}] Dropping undecodable datagram: {e}")
+            return False
+
+        if not isinstance(frame, dict):
+            return False
+
+        return self.receive_frame(frame, now)
+
+    def receive_frame(self, frame: Dict[str, Any], now: float) -> bool:
+        """
+        Feed an already decoded frame received from the device
+
+        Returns:
+            True if the frame belonged to a pending request
+        """
+        idp = frame.get("idp")
+        if not isinstance(idp, int):
+            return False
+
+        request = self._by_idp.get(idp)
+        if request is None:
+            return False
+
+        if frame.get("res") == 99:
+            if frame.get("frm") == "mst":
+                if self.verbose:
+                    _LOGGER.debug(f"  ✓ [{self.device_id}] ACK received (idp:{idp})")
+                request.ack_at = now
+                request.deadline = min(request.deadline, now + self.ack_timeout)
+            return True
+
+        if self.verbose:
+            _LOGGER.debug(f"  ✓ [{self.device_id}] Response received (idp:{idp})")
+            if request.idp_sync_attempt > 0:
+                _LOGGER.debug(
+                    f"  ✓ [{self.device_id}] IDP synchronized after {request.idp_sync_attempt} increments")
+
+        ack = {"idp": idp, "frm": "app", "res": 99}
+        self._outgoing.append(OutgoingDatagram(
+            request_id=request.request_id,
+            idp=idp,
+            data=json.dumps(ack).encode('utf-8'),
+            is_ack=True,
+        ))
+
+        self._complete(request, frame, rtt=now - request.sent_at)
+        return True
+
+    def tick(self, now: float) -> None:
+        """Advance timers: fire expired response timeouts and scheduled retries"""
+        expired = [r for r in self._requests.values() if r.deadline <= now]
+
+        for request in expired:
+            if request.waiting_retry:
+                if self.verbose:
+                    _LOGGER.debug(f"↻ [{self.device_id}] Retry {request.attempt}/{request.max_attempts}")
+                request.waiting_retry = False
+                request.idp_sync_attempt = 0
+                self._send_attempt(request, now)
+                continue
+
+            request.timeouts += 1
+            if request.timeouts == 1:
+                self._first_timeouts.append(request.request_id)
+            if self.verbose:
+                if request.ack_at is not None:
+                    _LOGGER.debug(f"  ⚠ [{self.device_id}] ACK received but no status - IDP may be out of sync")
+                else:
+                    _LOGGER.debug(f"  ⚠ [{self.device_id}] No response for IDP {request.idp} - likely out of sync")
+            self._release_idp(request)
+
+            request.idp_sync_attempt += 1
+            if request.idp_sync_attempt < self.max_idp_sync:
+                if self.verbose:
+                    _LOGGER.debug(
+                        f"  ↻ [{self.device_id}] IDP sync attempt {request.idp_sync_attempt}/{self.max_idp_sync}")
+                self._send_attempt(request, now)
+                continue
+
+            # After all IDP sync attempts failed, reset IDP counter
+            if request.attempt < request.max_attempts:
+                if self.verbose:
+                    _LOGGER.debug(f"  ⟲ [{self.device_id}] Resetting IDP counter to range start")
+                self.reset_idp()
+                request.attempt += 1
+                request.waiting_retry = True
+                request.deadline = now + self.retry_delay
+                continue
+
+            self._complete(request, None)
+
+    # ----------------------------
+    # OUTPUTS
+    # ----------------------------
+
+    def data_to_send(self) -> List[OutgoingDatagram]:
+        """Drain the datagrams waiting to be sent"""
+        outgoing, self._outgoing = self._outgoing, []
+        return outgoing
+
+    def results(self) -> List[RequestResult]:
+        """Drain the requests completed since the last call"""
+        results, self._results = self._results, []
+        return results
+
+    def first_timeouts(self) -> List[int]:
+        """Drain the IDs of the requests that lost their first attempt since the last call"""
+        first_timeouts, self._first_timeouts = self._first_timeouts, []
+        return [request_id for request_id in first_timeouts if request_id in self._requests]
+
+    def next_deadline(self) -> Optional[float]:
+        """Earliest time at which tick() has work to do, or None if idle"""
+        if not self._requests:
+            return None
+        return min(r.deadline for r in self._requests.values())
+
+    # ----------------------------
+    # INTERNAL METHODS
+    # ----------------------------
+
+    def _next_idp(self) -> int:
+        """Get next IDP within allocated range"""
+        idp = self._idp_counter
+        self._idp_counter += 1
+
+        # Wrap around within allocated range
+        if self._idp_counter >= (self._idp_range_start + self._idp_range_size):
+            self._idp_counter = self._idp_range_start
+
+        return idp
+
+    def _send_attempt(self, request: _PendingRequest, now: float) -> None:
+        """Allocate a fresh IDP for the request and queue it for sending"""
+        idp = self._next_idp()
+
+        # An IDP still held by an older request after a full wrap is stale
+        stale = self._by_idp.pop(idp, None)
+        if stale is not None:
+            stale.idp = None
+
+        request.idp = idp
+        request.sent_at = now
+        request.ack_at = None
+        request.deadline = now + self.response_timeout
+        self._by_idp[idp] = request
+
+        cmd = {**request.cmd, "idp": idp}
+        self._outgoing.append(OutgoingDatagram(
+            request_id=request.request_id,
+            idp=idp,
+            data=json.dumps(cmd).encode('utf-8'),
+        ))
+
+        if self.verbose:
+            _LOGGER.debug(f"→ [{self.device_id}] QUEUED: {cmd.get('cmd', 'unknown')} (idp:{idp})")
+
+    def _release_idp(self, request: _PendingRequest) -> None:
+        """Stop matching frames for the request's current IDP"""
+        if request.idp is not None and self._by_idp.get(request.idp) is request:
+            del self._by_idp[request.idp]
+        request.idp = None
+
+    def _complete(self, request: _PendingRequest, response: Optional[Dict[str, Any]],
+                  rtt: Optional[float] = None) -> None:
+        """Record the outcome of a request and stop tracking it"""
+        self._release_idp(request)
+        self._requests.pop(request.request_id, None)
+        self._results.append(RequestResult(
+            request_id=request.request_id,
+            response=response,
+            attempts=request.attempt,
+            timeouts=request.timeouts,
+            rtt=rtt,
+        ))
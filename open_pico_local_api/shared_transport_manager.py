@@ -8,9 +8,13 @@ responses based on IDP ranges assigned to each device.
 import logging
 import asyncio
 import json
-from typing import Dict, Optional, Tuple
+from typing import Any, Dict, Optional, Set, Tuple
 from dataclasses import dataclass
 
+from .utils.congestion_control import AimdWindow
+from .utils.constants import PUSH_FRAME_COMMANDS
+from .utils.send_pacer import SendPacer
+
 _LOGGER = logging.getLogger(__name__)
 
 
@@ -49,25 +53,41 @@ class SharedPicoProtocol(asyncio.DatagramProtocol):
                 print(f"← RECV from {addr}: cmd={cmd}, idp={idp}")
 
             # Route response to correct device based on IDP
+            cmd = response.get('cmd', '')
             idp = response.get('idp')
-            if idp is not None:
-                device_id = self.transport_manager._find_device_by_idp(idp)
-                if device_id:
-                    registration = self.transport_manager._devices[device_id]
-                    # Put in device's response queue
-                    registration.response_queue.put_nowait((response, addr))
-
-                    # Trigger callbacks if any
-                    cmd = response.get('cmd', '')
-                    if cmd in registration.event_callbacks:
-                        callback = registration.event_callbacks[cmd]
-                        asyncio.create_task(self._run_callback(callback, response))
-                else:
-                    if self.verbose:
-                        print(f"⚠ No device found for IDP {idp}")
-            else:
+            device_id = self.transport_manager._find_device_by_idp(idp) if idp is not None else None
+            if device_id:
+                registration = self.transport_manager._devices[device_id]
+                # Put in device's response queue
+                registration.response_queue.put_nowait((response, addr))
+
+                # Trigger callbacks if any
+                if cmd in registration.event_callbacks:
+                    callback = registration.event_callbacks[cmd]
+                    asyncio.create_task(self._run_callback(callback, response))
+                return
+
+            # An IDP outside every range is a late answer to a request we forgot,
+            # unless the frame is a status the device may have pushed on its own
+            if idp is not None and cmd not in PUSH_FRAME_COMMANDS:
+                if self.verbose:
+                    print(f"⚠ Stale answer from {addr[0]} dropped: cmd={cmd}, idp={idp}")
+                return
+
+            # A frame the device pushed on its own, routed by source address
+            # to the callbacks of its cmd, or to the "*" callback
+            device_id = self.transport_manager._find_device_by_address(addr[0])
+            if device_id is None:
                 if self.verbose:
-                    print(f"⚠ Response without IDP: {response}")
+                    print(f"⚠ No device found for IDP {idp} from {addr[0]}")
+                return
+
+            registration = self.transport_manager._devices[device_id]
+            callback = registration.event_callbacks.get(cmd, registration.event_callbacks.get("*"))
+            if callback:
+                asyncio.create_task(self._run_callback(callback, response))
+            elif self.verbose:
+                print(f"⚠ Unsolicited frame from '{device_id}' dropped: cmd={cmd}, idp={idp}")
 
         except json.JSONDecodeError as e:
             if self.verbose:
@@ -126,7 +146,11 @@ class SharedTransportManager:
         self._initialized = False
         self._next_idp_range = 1  # Start IDP allocation from 1
         self._idp_range_size = 10000  # Allocate 10k IDPs per device
+        self._idp_ranges: Dict[str, int] = {}  # Range start kept per device across reconnects
         self._init_lock = asyncio.Lock()  # Lock for thread-safe initialization
+        self._pacer: Optional[SendPacer] = None  # Spreads non-priority sends over time
+        self._congestion: Optional[AimdWindow] = None  # Fleet-wide window on outstanding requests
+        self._slot_waiters: Set[str] = set()  # Devices refused a request slot
 
     @classmethod
     async def get_instance(cls):
@@ -140,13 +164,27 @@ class SharedTransportManager:
                 cls._instance = cls()
         return cls._instance
 
-    async def initialize(self, local_port: int = 40069, verbose: bool = False):
+    async def initialize(
+        self,
+        local_port: int = 40069,
+        verbose: bool = False,
+        max_packets_per_second: Optional[float] = 100.0,
+        device_packets_per_second: Optional[float] = 10.0,
+        device_burst: int = 3,
+        congestion_control: bool = True,
+        max_outstanding_requests: int = 64
+    ):
         """
         Initialize the shared UDP transport
 
         Args:
             local_port: Local port to bind to
             verbose: Enable verbose logging
+            max_packets_per_second: Send budget of the whole socket (None or 0 disables it)
+            device_packets_per_second: Send budget of each device (None or 0 disables it)
+            device_burst: Packets a device may send back-to-back before being paced
+            congestion_control: Adapt the number of outstanding requests fleet-wide (AIMD)
+            max_outstanding_requests: Upper bound of the congestion window
         """
         # Thread-safe initialization check
         async with self._init_lock:
@@ -157,6 +195,16 @@ class SharedTransportManager:
 
             self._local_port = local_port
             self._verbose = verbose
+            self._pacer = SendPacer(
+                packets_per_second=max_packets_per_second,
+                device_packets_per_second=device_packets_per_second,
+                device_burst=device_burst
+            )
+            self._congestion = AimdWindow(
+                initial_window=max(1.0, max_outstanding_requests / 2),
+                max_window=max_outstanding_requests
+            ) if congestion_control else None
+            self._slot_waiters.clear()
 
             try:
                 loop = asyncio.get_running_loop()
@@ -188,7 +236,8 @@ class SharedTransportManager:
             ip: Device IP address
             port: Device port
             response_queue: Queue to receive responses
-            event_callbacks: Optional event callbacks
+            event_callbacks: Optional callbacks by cmd, kept by reference so callbacks
+                added later are seen. "*" receives unsolicited frames of any cmd
 
         Returns:
             Tuple of (idp_range_start, idp_range_size)
@@ -201,16 +250,20 @@ class SharedTransportManager:
             reg = self._devices[device_id]
             return (reg.idp_range_start, reg.idp_range_size)
 
-        # Allocate IDP range for this device
-        idp_range_start = self._next_idp_range
-        self._next_idp_range += self._idp_range_size
+        # Allocate IDP range for this device, the same one on every reconnect so
+        # late answers to its old requests are still recognized as answers
+        idp_range_start = self._idp_ranges.get(device_id)
+        if idp_range_start is None:
+            idp_range_start = self._next_idp_range
+            self._next_idp_range += self._idp_range_size
+            self._idp_ranges[device_id] = idp_range_start
 
         registration = DeviceRegistration(
             device_id=device_id,
             ip=ip,
             port=port,
             response_queue=response_queue,
-            event_callbacks=event_callbacks or {},
+            event_callbacks=event_callbacks if event_callbacks is not None else {},
             idp_range_start=idp_range_start,
             idp_range_size=self._idp_range_size
         )
@@ -227,6 +280,9 @@ class SharedTransportManager:
         """Unregister a device"""
         if device_id in self._devices:
             del self._devices[device_id]
+            if self._pacer:
+                self._pacer.remove_device(device_id)
+            self._slot_waiters.discard(device_id)
             if self._verbose:
                 print(f"✓ Unregistered device '{device_id}'")
 
@@ -237,16 +293,92 @@ class SharedTransportManager:
                 return device_id
         return None
 
-    async def send_to_device(self, device_id: str, data: bytes):
-        """Send data to a specific device"""
+    def _find_device_by_address(self, ip: str) -> Optional[str]:
+        """Find which device sends from an IP address"""
+        for device_id, reg in self._devices.items():
+            if reg.ip == ip:
+                return device_id
+        return None
+
+    async def send_to_device(self, device_id: str, data: bytes, priority: bool = False):
+        """
+        Send data to a specific device
+
+        Args:
+            device_id: Registered device to send to
+            data: Raw datagram
+            priority: Skip the pacing wait (ACKs and user-initiated commands)
+        """
         if device_id not in self._devices:
             raise ValueError(f"Device '{device_id}' not registered")
 
-        registration = self._devices[device_id]
+        waited = 0.0
+        if self._pacer:
+            waited = await self._pacer.acquire(device_id, priority=priority)
+
+        # The device or the transport may have gone away while we were paced
+        registration = self._devices.get(device_id)
+        if registration is None:
+            raise ValueError(f"Device '{device_id}' not registered")
+        if self._transport is None:
+            raise ConnectionError("Shared transport is closed")
+
         self._transport.sendto(data, (registration.ip, registration.port))
 
         if self._verbose:
-            print(f"→ SENT to {device_id} ({registration.ip}:{registration.port})")
+            paced = f", paced {waited * 1000:.1f}ms" if waited > 0 else ""
+            print(f"→ SENT to {device_id} ({registration.ip}:{registration.port}{paced})")
+
+    def try_acquire_request_slot(self, device_id: str, priority: bool = False) -> bool:
+        """
+        Take a slot in the congestion window for a new request
+
+        Priority requests always get a slot (they still count as outstanding).
+        A refused device is woken through its response queue once a slot frees up.
+
+        Args:
+            device_id: Device that wants to send
+            priority: Bypass the window (interactive commands)
+
+        Returns:
+            True if the request may be sent now
+        """
+        if self._congestion is None:
+            return True
+
+        if self._congestion.try_acquire(force=priority):
+            return True
+
+        self._slot_waiters.add(device_id)
+        return False
+
+    def release_request_slot(self, rtt: Optional[float] = None, timed_out: bool = False):
+        """
+        Return a slot taken with try_acquire_request_slot()
+
+        Args:
+            rtt: Round-trip time of the answered request, if any
+            timed_out: Whether the request lost at least one attempt to a timeout
+        """
+        if self._congestion is None:
+            return
+
+        self._congestion.release(rtt=rtt, timed_out=timed_out)
+
+        if self._slot_waiters and self._congestion.available:
+            waiters, self._slot_waiters = self._slot_waiters, set()
+            for device_id in waiters:
+                registration = self._devices.get(device_id)
+                if registration:
+                    # None is the driver's wakeup sentinel
+                    registration.response_queue.put_nowait(None)
+
+    @property
+    def congestion_diagnostics(self) -> Optional[Dict[str, Any]]:
+        """Congestion window size, RTT estimates and resize history (None if disabled)"""
+        if self._congestion is None:
+            return None
+        return {**self._congestion.diagnostics(), "waiting_devices": sorted(self._slot_waiters)}
 
     async def shutdown(self):
         """Shutdown the shared transport"""
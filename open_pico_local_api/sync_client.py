@@ -0,0 +1,267 @@
+"""
+Thread-safe synchronous facade for the Pico library
+
+SyncPicoFleet owns one background event loop thread and the shared UDP
+transport. Every SyncPicoClient created from it runs its calls on that loop,
+so any number of caller threads share one socket and one IDP space.
+
+Usage:
+    with SyncPicoFleet(local_port=40069) as fleet:
+        living_room = fleet.add_client("192.168.1.100", "1234", device_id="living_room")
+        status = living_room.get_status(timeout=10)
+        print(status.sensors.temperature_celsius)
+
+        for device_id, result in fleet.get_status_all(timeout=30).items():
+            print(device_id, result.ok)
+"""
+
+import logging
+import threading
+from typing import Any, Dict, Iterable, List, Optional, Union
+
+from .enums.device_mode_enum import DeviceModeEnum
+from .enums.target_humidity_enum import TargetHumidityEnum
+from .models.command_response_model import CommandResponseModel
+from .models.fleet_result_model import FleetResultModel
+from .models.pico_device_model import PicoDeviceModel
+from .pico_client import PicoClient
+from .pico_fleet import PicoFleet
+from .shared_transport_manager import SharedTransportManager
+from .utils.background_loop import BackgroundEventLoop
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class SyncPicoClient:
+    """
+    Blocking wrapper around a PicoClient living on a background event loop.
+
+    Instances are created by SyncPicoFleet.add_client() and are safe to use
+    from any thread. Every method accepts a timeout in seconds (defaulting to
+    the fleet's default_timeout) and raises TimeoutError when it expires.
+    """
+
+    def __init__(self, runner: BackgroundEventLoop, client: PicoClient, default_timeout: Optional[float] = 30.0):
+        self._runner = runner
+        self._client = client
+        self.default_timeout = default_timeout
+
+    @property
+    def device_id(self) -> str:
+        """Device ID of the wrapped client"""
+        return self._client.device_id
+
+    @property
+    def ip(self) -> str:
+        """IP address of the wrapped client"""
+        return self._client.ip
+
+    @property
+    def connected(self) -> bool:
+        """Check if device is connected"""
+        return self._client.connected
+
+    def connect(self, timeout: Optional[float] = None) -> None:
+        """Connect to the Pico device"""
+        self._run(self._client.connect(), timeout)
+
+    def disconnect(self, timeout: Optional[float] = None) -> None:
+        """Disconnect from the Pico"""
+        self._run(self._client.disconnect(), timeout)
+
+    def get_status(self, retry: bool = True, timeout: Optional[float] = None) -> PicoDeviceModel:
+        """Get device status"""
+        return self._run(self._client.get_status(retry=retry), timeout)
+
+    def turn_on(self, retry: bool = True, timeout: Optional[float] = None) -> CommandResponseModel:
+        """Turn the device on"""
+        return self._run(self._client.turn_on(retry=retry), timeout)
+
+    def turn_off(self, retry: bool = True, timeout: Optional[float] = None) -> CommandResponseModel:
+        """Turn the device off"""
+        return self._run(self._client.turn_off(retry=retry), timeout)
+
+    def change_operating_mode(self, mode: Union[DeviceModeEnum, int], retry: bool = True,
+                              timeout: Optional[float] = None) -> CommandResponseModel:
+        """Change the device operating mode"""
+        return self._run(self._client.change_operating_mode(mode, retry=retry), timeout)
+
+    def change_fan_speed(self, percentage: int, retry: bool = True, force=False,
+                         timeout: Optional[float] = None) -> CommandResponseModel:
+        """Change the fan speed"""
+        return self._run(self._client.change_fan_speed(percentage, retry=retry, force=force), timeout)
+
+    def set_night_mode(self, enable: bool, retry: bool = True, force=False,
+                       timeout: Optional[float] = None) -> CommandResponseModel:
+        """Set night mode"""
+        return self._run(self._client.set_night_mode(enable, retry=retry, force=force), timeout)
+
+    def set_led_status(self, enable: bool, retry: bool = True, timeout: Optional[float] = None) -> CommandResponseModel:
+        """Set LED status"""
+        return self._run(self._client.set_led_status(enable, retry=retry), timeout)
+
+    def set_target_humidity(self, target_humidity: TargetHumidityEnum, retry: bool = True, force=False,
+                            timeout: Optional[float] = None) -> CommandResponseModel:
+        """Set target humidity"""
+        return self._run(self._client.set_target_humidity(target_humidity, retry=retry, force=force), timeout)
+
+    def apply_state(self, retry: bool = True, force=False, timeout: Optional[float] = None,
+                    **state: Any) -> CommandResponseModel:
+        """Apply several settings with a single upd_pico frame"""
+        return self._run(self._client.apply_state(retry=retry, force=force, **state), timeout)
+
+    def reset_maintenance(self, retry: bool = True, timeout: Optional[float] = None) -> CommandResponseModel:
+        """Reset filter maintenance"""
+        return self._run(self._client.reset_maintenance(retry=retry), timeout)
+
+    def reset_idp(self, timeout: Optional[float] = None) -> None:
+        """Manually reset IDP counter to start of range"""
+        self._run(self._client.reset_idp(), timeout)
+
+    def _run(self, coro, timeout: Optional[float]) -> Any:
+        """Run a client coroutine on the background loop"""
+        return self._runner.run(coro, self.default_timeout if timeout is None else timeout)
+
+
+class SyncPicoFleet:
+    """
+    Owner of the background event loop, the shared transport and its clients.
+
+    Closing the fleet disconnects every client, shuts the transport down and
+    stops the loop thread.
+    """
+
+    def __init__(
+            self,
+            local_port: int = 40069,
+            verbose: bool = False,
+            concurrency: int = 8,
+            pacing: float = 0.0,
+            default_timeout: Optional[float] = 30.0
+    ):
+        self.local_port = local_port
+        self.verbose = verbose
+        self.default_timeout = default_timeout
+
+        self._clients: Dict[str, PicoClient] = {}
+        self._sync_clients: Dict[str, SyncPicoClient] = {}
+        self._fleet = PicoFleet(self._clients, concurrency=concurrency, pacing=pacing)
+        self._lock = threading.Lock()
+        self._transport_manager: Optional[SharedTransportManager] = None
+
+        self._runner = BackgroundEventLoop()
+        self._runner.start()
+        try:
+            self._runner.run(self._initialize(), default_timeout)
+        except Exception:
+            self._runner.stop()
+            raise
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+        return False
+
+    @property
+    def device_ids(self) -> List[str]:
+        """IDs of the devices in the fleet"""
+        with self._lock:
+            return list(self._sync_clients)
+
+    def add_client(
+            self,
+            ip: str,
+            pin: str,
+            device_id: Optional[str] = None,
+            connect: bool = True,
+            timeout: Optional[float] = None,
+            **client_kwargs: Any
+    ) -> SyncPicoClient:
+        """
+        Create (or return the existing) client for a device
+
+        Extra keyword arguments are passed to PicoClient.
+        """
+        device_id = device_id or f"pico_{ip.replace('.', '_')}"
+
+        with self._lock:
+            existing = self._sync_clients.get(device_id)
+            if existing is not None:
+                return existing
+
+            client = self._runner.run(self._create_client(ip, pin, device_id, client_kwargs), self._timeout(timeout))
+            sync_client = SyncPicoClient(self._runner, client, self.default_timeout)
+            self._sync_clients[device_id] = sync_client
+
+        if connect:
+            sync_client.connect(timeout=timeout)
+        return sync_client
+
+    def client(self, device_id: str) -> Optional[SyncPicoClient]:
+        """Get a client by device_id"""
+        with self._lock:
+            return self._sync_clients.get(device_id)
+
+    def connect_all(self, device_ids: Optional[Iterable[str]] = None,
+                    timeout: Optional[float] = None) -> Dict[str, FleetResultModel]:
+        """Connect every selected device"""
+        return self._runner.run(self._fleet.connect_all(device_ids), self._timeout(timeout))
+
+    def get_status_all(self, device_ids: Optional[Iterable[str]] = None, retry: bool = True,
+                       timeout: Optional[float] = None) -> Dict[str, FleetResultModel]:
+        """Read the status of every selected device"""
+        return self._runner.run(self._fleet.get_status_all(device_ids, retry=retry), self._timeout(timeout))
+
+    def apply_all(self, device_ids: Optional[Iterable[str]] = None, retry: bool = True, force: bool = False,
+                  timeout: Optional[float] = None, **state: Any) -> Dict[str, FleetResultModel]:
+        """Apply the same settings to every selected device"""
+        return self._runner.run(
+            self._fleet.apply_all(device_ids, retry=retry, force=force, **state),
+            self._timeout(timeout)
+        )
+
+    def close(self, timeout: Optional[float] = None) -> None:
+        """Disconnect all clients, shut the transport down and stop the loop"""
+        if not self._runner.is_running:
+            return
+
+        try:
+            self._runner.run(self._shutdown(), self._timeout(timeout))
+        except Exception as e:
+            _LOGGER.error(f"✗ Error while closing sync fleet: {e}")
+        finally:
+            self._runner.stop()
+            with self._lock:
+                self._sync_clients.clear()
+
+    def _timeout(self, timeout: Optional[float]) -> Optional[float]:
+        """Resolve a per-call timeout against the default"""
+        return self.default_timeout if timeout is None else timeout
+
+    async def _initialize(self) -> None:
+        """Bind the shared transport on the background loop"""
+        self._transport_manager = await SharedTransportManager.get_instance()
+        await self._transport_manager.initialize(local_port=self.local_port, verbose=self.verbose)
+
+    async def _create_client(self, ip: str, pin: str, device_id: str, client_kwargs: Dict[str, Any]) -> PicoClient:
+        """Create a PicoClient on the background loop"""
+        client = PicoClient(
+            ip=ip,
+            pin=pin,
+            device_id=device_id,
+            local_port=self.local_port,
+            verbose=self.verbose,
+            use_shared_transport=True,
+            **client_kwargs
+        )
+        self._clients[device_id] = client
+        return client
+
+    async def _shutdown(self) -> None:
+        """Disconnect every client and close the shared transport"""
+        await self._fleet.disconnect_all()
+        self._clients.clear()
+        if self._transport_manager:
+            await self._transport_manager.shutdown()
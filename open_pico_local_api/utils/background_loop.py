@@ -0,0 +1,80 @@
+import asyncio
+import concurrent.futures
+import threading
+from typing import Any, Coroutine, Optional
+
+
+class BackgroundEventLoop:
+    """
+    Asyncio event loop running in a dedicated daemon thread.
+
+    Lets synchronous code run coroutines on one shared loop from any thread.
+    """
+
+    def __init__(self, name: str = "open-pico-loop"):
+        self._name = name
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._started = threading.Event()
+
+    @property
+    def is_running(self) -> bool:
+        """Check if the loop thread is alive"""
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        """Start the loop thread and wait until the loop is running"""
+        if self.is_running:
+            return
+
+        self._started.clear()
+        self._thread = threading.Thread(target=self._run, name=self._name, daemon=True)
+        self._thread.start()
+        self._started.wait()
+
+    def run(self, coro: Coroutine[Any, Any, Any], timeout: Optional[float] = None) -> Any:
+        """
+        Run a coroutine on the loop and block until it finishes
+
+        Raises:
+            TimeoutError: if the coroutine did not finish within timeout
+                (the coroutine is cancelled)
+        """
+        if not self.is_running:
+            coro.close()
+            raise RuntimeError("Background event loop is not running")
+
+        if self._thread is threading.current_thread():
+            coro.close()
+            raise RuntimeError("Blocking call made from the background event loop thread")
+
+        future = asyncio.run_coroutine_threadsafe(coro, self._loop)
+        try:
+            return future.result(timeout)
+        except concurrent.futures.TimeoutError:
+            future.cancel()
+            raise TimeoutError(f"Operation did not complete within {timeout}s")
+
+    def stop(self) -> None:
+        """Stop the loop and join its thread"""
+        if not self.is_running:
+            return
+
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._thread = None
+
+    def _run(self) -> None:
+        """Thread body: own a fresh event loop until stop() is called"""
+        self._loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self._loop)
+        self._loop.call_soon(self._started.set)
+        try:
+            self._loop.run_forever()
+        finally:
+            pending = asyncio.all_tasks(self._loop)
+            for task in pending:
+                task.cancel()
+            if pending:
+                self._loop.run_until_complete(asyncio.gather(*pending, return_exceptions=True))
+            self._loop.close()
@@ -0,0 +1,136 @@
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Deque, Dict, Optional
+
+
+@dataclass
+class WindowChange:
+    """One resize of the congestion window"""
+    timestamp: float  # time.time() of the change
+    window: float
+    reason: str  # "increase", "timeout" or "rtt_inflation"
+
+
+class AimdWindow:
+    """
+    Additive-increase / multiplicative-decrease window on outstanding requests.
+
+    Every answered request grows the window by 1/window (about one slot per
+    round trip). A timed-out request, or a smoothed RTT that has inflated
+    well above the recent minimum, multiplies it by `decrease_factor`, at
+    most once per smoothed RTT (or `decrease_interval` before any RTT was
+    measured) so a single burst of losses only counts once.
+    """
+
+    def __init__(
+            self,
+            initial_window: float = 32.0,
+            min_window: float = 1.0,
+            max_window: float = 64.0,
+            decrease_factor: float = 0.5,
+            rtt_inflation: float = 3.0,
+            decrease_interval: float = 1.0,
+            history_size: int = 100
+    ):
+        if min_window < 1:
+            raise ValueError("min_window must be at least 1")
+        if not min_window <= initial_window <= max_window:
+            raise ValueError("initial_window must lie between min_window and max_window")
+
+        self.min_window = min_window
+        self.max_window = max_window
+        self.decrease_factor = decrease_factor
+        self.rtt_inflation = rtt_inflation
+        self.decrease_interval = decrease_interval
+
+        self.window = initial_window
+        self.outstanding = 0
+        self.srtt: Optional[float] = None
+        self.timeouts = 0
+        self.history: Deque[WindowChange] = deque(maxlen=history_size)
+
+        self._rtt_samples: Deque[float] = deque(maxlen=50)  # Recent RTTs for the base (minimum) RTT
+        self._last_decrease = float("-inf")
+        self._last_recorded = initial_window
+
+    @property
+    def min_rtt(self) -> Optional[float]:
+        """Smallest RTT among the recent samples"""
+        return min(self._rtt_samples) if self._rtt_samples else None
+
+    @property
+    def available(self) -> bool:
+        """Check if one more request fits in the window"""
+        return self.outstanding < int(self.window)
+
+    def try_acquire(self, force: bool = False) -> bool:
+        """
+        Take a slot for a new request
+
+        Args:
+            force: Take the slot even if the window is full (interactive commands)
+        """
+        if not force and not self.available:
+            return False
+        self.outstanding += 1
+        return True
+
+    def release(self, rtt: Optional[float] = None, timed_out: bool = False) -> None:
+        """
+        Return a slot, feeding the outcome of its request into the window
+
+        Args:
+            rtt: Round-trip time of the answered request, if any
+            timed_out: Whether the request lost at least one attempt to a timeout
+        """
+        self.outstanding = max(0, self.outstanding - 1)
+        now = time.monotonic()
+
+        if timed_out:
+            self.timeouts += 1
+            self._decrease(now, "timeout")
+            return
+
+        if rtt is None:
+            return  # Cancelled or failed locally: no signal about the network
+
+        self._rtt_samples.append(rtt)
+        self.srtt = rtt if self.srtt is None else 0.875 * self.srtt + 0.125 * rtt
+
+        if self.srtt > self.min_rtt * self.rtt_inflation:
+            self._decrease(now, "rtt_inflation")
+        else:
+            self.window = min(self.max_window, self.window + 1.0 / self.window)
+            # Record growth once per whole slot to keep the history readable
+            if int(self.window) != int(self._last_recorded):
+                self._record("increase")
+
+    def diagnostics(self) -> Dict[str, Any]:
+        """Snapshot of the window state and its recent history"""
+        return {
+            "window": round(self.window, 2),
+            "outstanding": self.outstanding,
+            "srtt": self.srtt,
+            "min_rtt": self.min_rtt,
+            "timeouts": self.timeouts,
+            "history": [
+                {"timestamp": change.timestamp, "window": round(change.window, 2), "reason": change.reason}
+                for change in self.history
+            ],
+        }
+
+    def _decrease(self, now: float, reason: str) -> None:
+        """Shrink the window, at most once per smoothed RTT"""
+        guard = self.srtt if self.srtt is not None else self.decrease_interval
+        if now - self._last_decrease < guard:
+            return
+        self._last_decrease = now
+        self.window = max(self.min_window, self.window * self.decrease_factor)
+        self._record(reason)
+
+    def _record(self, reason: str) -> None:
+        """Append the current window to the history"""
+        self._last_recorded = self.window
+        self.history.append(WindowChange(timestamp=time.time(), window=self.window, reason=reason))
+
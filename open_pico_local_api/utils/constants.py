@@ -9,6 +9,16 @@ MODULAR_FAN_SPEED_PRESET_MODES = [
     DeviceModeEnum.COMFORT_WINTER,
 ]
 
+# Fields whose presence marks a frame as carrying a full device status
+STATUS_FRAME_FIELDS = ("mod", "on_off", "v_tmpr", "v_umd")
+
+# Commands of the status frames a device may send on its own. Frames carrying
+# an IDP that answers none of our requests only count as pushes with these
+PUSH_FRAME_COMMANDS = ("stato_sync",)
+
+# Status fields that change on every frame without reflecting a state change
+VOLATILE_STATUS_FIELDS = ("idp", "frm", "res", "cmd", "cntr", "memfree", "up_time", "date", "time", "week")
+
 # Preset modes that support the selection of a desired level of humidity
 HUMIDITY_SELECTOR_PRESET_MODES = [
     DeviceModeEnum.HUMIDITY_RECOVERY,
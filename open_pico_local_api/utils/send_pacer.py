@@ -0,0 +1,97 @@
+import asyncio
+import time
+from typing import Dict, Optional
+
+
+class TokenBucket:
+    """
+    Token bucket kept as a theoretical arrival time (GCRA).
+
+    Instead of counting tokens, the bucket remembers when the next packet
+    would be due at the nominal rate; `burst` packets may run ahead of that.
+    Reservations are exact, so packets are spread with sub-millisecond
+    precision rather than released in clumps.
+    """
+
+    def __init__(self, rate: float, burst: int = 1):
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+
+        self.interval = 1.0 / rate
+        self.tolerance = self.interval * (max(burst, 1) - 1)
+        self._tat = 0.0  # Theoretical arrival time of the next packet
+
+    def earliest(self, now: float) -> float:
+        """Earliest time at which one more packet conforms"""
+        return max(now, self._tat - self.tolerance)
+
+    def commit(self, at: float) -> None:
+        """Record a packet sent at the given time"""
+        self._tat = max(self._tat, at) + self.interval
+
+
+class SendPacer:
+    """
+    Spreads outgoing datagrams over time.
+
+    Applies a global packets-per-second budget for the shared socket and a
+    token bucket per device. Priority packets (ACKs, interactive commands)
+    are sent immediately; they still consume budget, which pushes back the
+    normal traffic queued after them.
+    """
+
+    def __init__(
+            self,
+            packets_per_second: Optional[float] = 100.0,
+            device_packets_per_second: Optional[float] = 10.0,
+            device_burst: int = 3
+    ):
+        self._global = TokenBucket(packets_per_second) if packets_per_second else None
+        self._device_rate = device_packets_per_second
+        self._device_burst = device_burst
+        self._devices: Dict[str, TokenBucket] = {}
+
+    async def acquire(self, device_id: str, priority: bool = False) -> float:
+        """
+        Wait until a datagram for the device may be sent
+
+        Returns:
+            Seconds spent waiting
+        """
+        waited = 0.0
+        device = self._device_bucket(device_id)
+
+        # Per-device wait first, so a backlogged device does not reserve
+        # global slots far ahead and starve the others
+        if device is not None:
+            waited += await self._reserve(device, priority)
+        if self._global is not None:
+            waited += await self._reserve(self._global, priority)
+        return waited
+
+    def remove_device(self, device_id: str) -> None:
+        """Forget the bucket of an unregistered device"""
+        self._devices.pop(device_id, None)
+
+    def _device_bucket(self, device_id: str) -> Optional[TokenBucket]:
+        """Get or create the bucket of a device"""
+        if not self._device_rate:
+            return None
+
+        bucket = self._devices.get(device_id)
+        if bucket is None:
+            bucket = TokenBucket(self._device_rate, self._device_burst)
+            self._devices[device_id] = bucket
+        return bucket
+
+    @staticmethod
+    async def _reserve(bucket: TokenBucket, priority: bool) -> float:
+        """Take the next slot of a bucket and sleep until it comes up"""
+        now = time.monotonic()
+        send_at = now if priority else bucket.earliest(now)
+        bucket.commit(send_at)
+
+        delay = send_at - now
+        if delay > 0:
+            await asyncio.sleep(delay)
+        return delay
@@ -3,6 +3,7 @@ import logging
 from typing import Dict
 
 from .open_pico_local_api.pico_client import PicoClient
+from .open_pico_local_api.pico_fleet import PicoFleet
 from .open_pico_local_api.shared_transport_manager import SharedTransportManager
 
 _LOGGER = logging.getLogger(__name__)
@@ -15,15 +16,27 @@ class PicoClientManager:
     This class handles:
     - Shared transport initialization (single UDP socket for all devices)
     - Client creation with unique device IDs
+    - Bulk operations through the PicoFleet facade
     - Cleanup on shutdown
     """
 
-    def __init__(self, local_port: int = 40069, verbose: bool = False):
+    def __init__(
+        self,
+        local_port: int = 40069,
+        verbose: bool = False,
+        fleet_concurrency: int = 8,
+        fleet_pacing: float = 0.0,
+        max_packets_per_second: float | None = 100.0,
+        device_packets_per_second: float | None = 10.0
+    ):
         """Initialize the manager."""
         self._local_port = local_port
         self._verbose = verbose
+        self._max_packets_per_second = max_packets_per_second
+        self._device_packets_per_second = device_packets_per_second
         self._transport_manager = None
         self._clients: Dict[str, PicoClient] = {}
+        self._fleet = PicoFleet(self._clients, concurrency=fleet_concurrency, pacing=fleet_pacing)
         self._initialized = False
 
     async def initialize(self):
@@ -39,7 +52,9 @@ class PicoClientManager:
             # Initialize shared UDP socket
             await self._transport_manager.initialize(
                 local_port=self._local_port,
-                verbose=self._verbose
+                verbose=self._verbose,
+                max_packets_per_second=self._max_packets_per_second,
+                device_packets_per_second=self._device_packets_per_second
             )
 
             self._initialized = True
@@ -56,7 +71,9 @@ class PicoClientManager:
         device_id: str = None,
         timeout: float = 15,
         retry_attempts: int = 3,
-        retry_delay: float = 2.0
+        retry_delay: float = 2.0,
+        max_in_flight: int = 1,
+        status_max_age: float = 10.0
     ) -> PicoClient:
         """
         Create a new Pico client that uses the shared transport.
@@ -68,6 +85,8 @@ class PicoClientManager:
             timeout: Request timeout in seconds
             retry_attempts: Number of retry attempts
             retry_delay: Delay between retries
+            max_in_flight: Maximum concurrent requests to the device
+            status_max_age: Seconds a status stays valid for command pre-checks
 
         Returns:
             PicoClient instance configured for shared transport
@@ -95,7 +114,9 @@ class PicoClientManager:
             retry_attempts=retry_attempts,
             retry_delay=retry_delay,
             verbose=self._verbose,
-            use_shared_transport=True  # Key setting!
+            use_shared_transport=True,  # Key setting!
+            max_in_flight=max_in_flight,
+            status_max_age=status_max_age
         )
 
         # Store client reference
@@ -110,13 +131,12 @@ class PicoClientManager:
         _LOGGER.info("Shutting down PicoClientManager...")
 
         # Disconnect all clients
-        for device_id, client in self._clients.items():
-            try:
-                if client.connected:
-                    await client.disconnect()
-                    _LOGGER.debug("Disconnected client '%s'", device_id)
-            except Exception as e:
-                _LOGGER.error("Error disconnecting client '%s': %s", device_id, e)
+        results = await self._fleet.disconnect_all()
+        for device_id, result in results.items():
+            if result.ok:
+                _LOGGER.debug("Disconnected client '%s'", device_id)
+            else:
+                _LOGGER.error("Error disconnecting client '%s': %s", device_id, result.error)
 
         # Clear clients
         self._clients.clear()
@@ -141,6 +161,18 @@ class PicoClientManager:
         """Get number of registered clients."""
         return len(self._clients)
 
+    @property
+    def fleet(self) -> PicoFleet:
+        """Get the facade for bulk operations across all clients."""
+        return self._fleet
+
+    @property
+    def congestion_diagnostics(self) -> dict | None:
+        """Get the shared transport's congestion window state and history."""
+        if not self._transport_manager:
+            return None
+        return self._transport_manager.congestion_diagnostics
+
     def get_client(self, device_id: str) -> PicoClient | None:
         """Get a client by device_id."""
         return self._clients.get(device_id)
\ No newline at end of file
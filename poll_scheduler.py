@@ -0,0 +1,247 @@
+"""Fleet-wide poll scheduler for Open Pico devices."""
+from __future__ import annotations
+
+import asyncio
+import heapq
+import logging
+import random
+from dataclasses import dataclass, field
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.update_coordinator import UpdateFailed
+
+from .coordinator import MainCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+# Share of the interval a poll may move away from its slot
+DEFAULT_JITTER_FRACTION = 0.05
+
+# Seconds during which finished polls are collected before being published
+DEFAULT_BATCH_WINDOW = 0.05
+
+
+@dataclass(order=True)
+class _PollSlot:
+    """Next poll of one device."""
+
+    due: float
+    device_id: str = field(compare=False)
+    nominal: float = field(compare=False)  # Due time before jitter, so jitter never accumulates
+
+
+class FleetPollScheduler:
+    """
+    Single timer polling every device of the fleet.
+
+    Each device joining takes the middle of the largest gap between the
+    phases already in use within the poll interval, so the fleet stays
+    spread out without moving the devices already scheduled, and every poll
+    is moved by a small random jitter. Polls run on
+    one loop task instead of a timer per coordinator; results finishing
+    close together are handed to their coordinators in one batch.
+    Coordinators are created with update_interval=None and keep their own
+    update method, which this scheduler calls. Each device is rescheduled
+    with the poll interval its coordinator currently asks for, and brought
+    forward as soon as that interval shrinks.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        jitter_fraction: float = DEFAULT_JITTER_FRACTION,
+        batch_window: float = DEFAULT_BATCH_WINDOW,
+    ) -> None:
+        """Initialize the scheduler."""
+        self.hass = hass
+        self.jitter_fraction = jitter_fraction
+        self.batch_window = batch_window
+
+        self._coordinators: dict[str, MainCoordinator] = {}
+        self._slots: list[_PollSlot] = []
+        self._polling: set[str] = set()
+        self._results: list[tuple[MainCoordinator, object, Exception | None, object]] = []
+        self._flush_handle: asyncio.TimerHandle | None = None
+        self._wakeup = asyncio.Event()
+        self._task: asyncio.Task | None = None
+        self._poll_tasks: set[asyncio.Task] = set()
+
+    @property
+    def device_ids(self) -> list[str]:
+        """Get the IDs of the scheduled devices."""
+        return list(self._coordinators)
+
+    @callback
+    def async_add(self, coordinator: MainCoordinator) -> None:
+        """Start polling a coordinator's device."""
+        if coordinator.device_id in self._coordinators:
+            return
+
+        self._coordinators[coordinator.device_id] = coordinator
+        coordinator.set_poll_interval_listener(lambda: self._async_interval_shrunk(coordinator))
+        self._add_slot(coordinator)
+        self._wakeup.set()
+
+    @callback
+    def async_remove(self, coordinator: MainCoordinator) -> None:
+        """Stop polling a coordinator's device."""
+        if self._coordinators.pop(coordinator.device_id, None) is None:
+            return
+
+        coordinator.set_poll_interval_listener(None)
+        self._slots = [slot for slot in self._slots if slot.device_id != coordinator.device_id]
+        heapq.heapify(self._slots)
+        self._wakeup.set()
+
+    @callback
+    def async_start(self) -> None:
+        """Start the scheduler loop."""
+        if self._task is not None:
+            return
+
+        self._task = self.hass.async_create_background_task(
+            self._async_run(), name="open_pico fleet poll scheduler"
+        )
+
+    async def async_stop(self) -> None:
+        """Stop the scheduler loop and running polls, and drop unpublished results."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+        # Polls still running would otherwise publish into unloaded coordinators
+        poll_tasks = list(self._poll_tasks)
+        for task in poll_tasks:
+            task.cancel()
+        await asyncio.gather(*poll_tasks, return_exceptions=True)
+
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        self._results.clear()
+
+    @callback
+    def _async_interval_shrunk(self, coordinator: MainCoordinator) -> None:
+        """Bring a device's next poll forward to its new, shorter interval."""
+        now = self.hass.loop.time()
+        interval = self._interval(coordinator)
+
+        for index, slot in enumerate(self._slots):
+            if slot.device_id != coordinator.device_id:
+                continue
+            if slot.due > now + interval:
+                nominal = now + interval
+                self._slots[index] = _PollSlot(self._jittered(nominal, interval), slot.device_id, nominal)
+                heapq.heapify(self._slots)
+                self._wakeup.set()
+            return
+
+    def _add_slot(self, coordinator: MainCoordinator) -> None:
+        """Schedule a new device in the middle of the largest gap between phases."""
+        now = self.hass.loop.time()
+        phases = sorted(
+            ((slot.nominal - now) / self._interval(self._coordinators[slot.device_id])) % 1.0
+            for slot in self._slots
+            if slot.device_id in self._coordinators
+        )
+
+        # Devices join right after their first status was read: without
+        # other devices, the first poll is due one interval later
+        phase = 1.0
+        if phases:
+            gaps = [(phases[0] + 1.0 - phases[-1], phases[-1])]
+            gaps += [(following - current, current) for current, following in zip(phases, phases[1:])]
+            width, start = max(gaps)
+            phase = (start + width / 2) % 1.0
+
+        interval = self._interval(coordinator)
+        nominal = now + interval * phase
+        heapq.heappush(self._slots, _PollSlot(self._jittered(nominal, interval), coordinator.device_id, nominal))
+
+    def _interval(self, coordinator: MainCoordinator) -> float:
+        """Get the poll interval of a device in seconds."""
+        return coordinator.poll_interval.total_seconds()
+
+    def _jittered(self, nominal: float, interval: float) -> float:
+        """Move a due time by a random share of the interval."""
+        jitter = interval * self.jitter_fraction
+        return nominal + random.uniform(-jitter, jitter)
+
+    async def _async_run(self) -> None:
+        """Wait for the next due slot and start its poll, forever."""
+        while True:
+            self._wakeup.clear()
+            now = self.hass.loop.time()
+
+            while self._slots and self._slots[0].due <= now:
+                slot = heapq.heappop(self._slots)
+                coordinator = self._coordinators.get(slot.device_id)
+                if coordinator is None:
+                    continue
+
+                self._start_poll(coordinator)
+
+                # Anchor the next slot to the nominal grid so phases never drift together
+                interval = self._interval(coordinator)
+                nominal = max(slot.nominal + interval, now)
+                heapq.heappush(self._slots, _PollSlot(self._jittered(nominal, interval), slot.device_id, nominal))
+
+            timeout = self._slots[0].due - now if self._slots else None
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=timeout)
+            except asyncio.TimeoutError:
+                pass
+
+    def _start_poll(self, coordinator: MainCoordinator) -> None:
+        """Run one poll in the background, unless the previous one is still running."""
+        if coordinator.device_id in self._polling:
+            _LOGGER.debug("[%s] Previous poll still running, slot skipped", coordinator.device_name)
+            return
+
+        self._polling.add(coordinator.device_id)
+        task = self.hass.async_create_background_task(
+            self._async_poll(coordinator), name=f"open_pico poll {coordinator.device_id}"
+        )
+        self._poll_tasks.add(task)
+        task.add_done_callback(self._poll_tasks.discard)
+
+    async def _async_poll(self, coordinator: MainCoordinator) -> None:
+        """Fetch a device's status through its coordinator and queue the result."""
+        try:
+            data = await coordinator.async_update_data()
+        except UpdateFailed as err:
+            self._queue_result(coordinator, None, err)
+        except Exception as err:  # noqa: BLE001
+            self._queue_result(coordinator, None, UpdateFailed(f"Unexpected error: {err}"))
+        else:
+            self._queue_result(coordinator, data, None)
+        finally:
+            self._polling.discard(coordinator.device_id)
+
+    def _queue_result(self, coordinator: MainCoordinator, data: object, error: Exception | None) -> None:
+        """Collect a poll result for the next batch, with the data it was read against."""
+        self._results.append((coordinator, data, error, coordinator.data))
+        if self._flush_handle is None:
+            self._flush_handle = self.hass.loop.call_later(self.batch_window, self._flush_results)
+
+    @callback
+    def _flush_results(self) -> None:
+        """Publish every collected result to its coordinator."""
+        self._flush_handle = None
+        results, self._results = self._results, []
+
+        for coordinator, data, error, published in results:
+            if coordinator.device_id not in self._coordinators:
+                continue
+            # A command response or push published while the result waited is newer
+            if coordinator.data is not published:
+                _LOGGER.debug("[%s] Newer data published meanwhile, poll result dropped", coordinator.device_name)
+                continue
+            if error is not None:
+                coordinator.async_set_update_error(error)
+            else:
+                coordinator.async_set_updated_data(data)
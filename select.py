@@ -45,6 +45,7 @@ class PicoTargetHumiditySelect(BaseEntity, SelectEntity):
     """Representation of a Pico Target Humidity Select."""
 
     _attr_translation_key = "target_humidity"
+    _status_fields = frozenset({"s_umd", "mod"})
 
     def __init__(self, coordinator: MainCoordinator, device_index: int):
         """Initialize the select."""
@@ -110,6 +111,7 @@ class PicoPresetModeSelect(BaseEntity, SelectEntity):
     """Representation of a Pico Preset Mode Select."""
 
     _attr_translation_key = "preset_mode"
+    _status_fields = frozenset({"mod"})
 
     def __init__(self, coordinator: MainCoordinator, device_index: int):
         """Initialize the select."""
@@ -149,7 +151,7 @@ class PicoPresetModeSelect(BaseEntity, SelectEntity):
         try:
             # Convert int to DeviceModeEnum
             mode_enum = DeviceModeEnum(mode_int)
-            await self.coordinator.async_set_mode(mode_enum)
+            await self.coordinator.async_apply_state(on=True, mode=mode_enum)
         except Exception as err:
             _LOGGER.error("Failed to set preset mode: %s", err)
             raise HomeAssistantError(f"Failed to set preset mode: {err}") from err
\ No newline at end of file
@@ -1,5 +1,6 @@
 """Sensor platform for Open Pico integration."""
 import logging
+import time
 
 from homeassistant.components.sensor import (
     SensorEntity,
@@ -15,8 +16,13 @@ from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.typing import ConfigType
 
-from .const import DOMAIN
-from .base import BaseEntity
+from .const import (
+    DEFAULT_SENSOR_MAX_PUBLISH_INTERVAL,
+    DEFAULT_SENSOR_MIN_PUBLISH_INTERVAL,
+    DOMAIN,
+    SENSOR_PUBLISH_DEFAULTS,
+)
+from .base import BaseEntity, async_add_capable_entities, has_air_quality
 from .coordinator import MainCoordinator
 
 _LOGGER = logging.getLogger(__name__)
@@ -33,111 +39,191 @@ async def async_setup_platform(
     # Get all coordinators from hass.data
     coordinators = hass.data[DOMAIN]["coordinators"]
 
-    # Create sensor entities for each coordinator/device
-    sensors = []
+    # Publishing policy of each sensor kind, configured options over the defaults
+    publish_options = hass.data[DOMAIN]["config"].get("sensor_publish", {})
+    policies = {
+        sensor: SensorPublishPolicy(**{**defaults, **publish_options.get(sensor, {})})
+        for sensor, defaults in SENSOR_PUBLISH_DEFAULTS.items()
+    }
+
+    # Create sensor entities for each coordinator/device, air quality ones only for devices having it
     for idx, coordinator in enumerate(coordinators):
-        sensors.extend([
-            PicoTemperatureSensor(coordinator, idx),
-            PicoHumiditySensor(coordinator, idx),
-            PicoAirQualitySensor(coordinator, idx),
-            PicoTVOCSensor(coordinator, idx),
-            PicoECO2Sensor(coordinator, idx),
+        async_add_capable_entities(coordinator, async_add_entities, [
+            (PicoTemperatureSensor(coordinator, idx, policies["temperature"]), None),
+            (PicoHumiditySensor(coordinator, idx, policies["humidity"]), None),
+            (PicoAirQualitySensor(coordinator, idx, policies["air_quality"]), has_air_quality),
+            (PicoTVOCSensor(coordinator, idx, policies["tvoc"]), has_air_quality),
+            (PicoECO2Sensor(coordinator, idx, policies["eco2"]), has_air_quality),
         ])
 
-    async_add_entities(sensors)
 
+class SensorPublishPolicy:
+    """
+    Decide when a measurement sensor publishes a new reading.
+
+    A reading is published once it moved away from the published value by
+    the deadband (absolute, or in percent of the published value, whichever
+    is larger) and at least min_interval seconds went by since the last
+    publish. Smaller moves are published anyway after max_interval seconds,
+    so the recorded state never drifts from the device for long.
+    """
+
+    def __init__(
+            self,
+            deadband: float = 0.0,
+            deadband_percent: float = 0.0,
+            min_interval: float = DEFAULT_SENSOR_MIN_PUBLISH_INTERVAL,
+            max_interval: float = DEFAULT_SENSOR_MAX_PUBLISH_INTERVAL,
+    ) -> None:
+        """Initialize the policy."""
+        self.deadband = deadband
+        self.deadband_percent = deadband_percent
+        self.min_interval = min_interval
+        self.max_interval = max(max_interval, min_interval)
+
+    def should_publish(self, published: float | None, value: float | None, elapsed: float) -> bool:
+        """Check if a reading replaces the published value after elapsed seconds."""
+        if value == published:
+            return False
+        if value is None or published is None:
+            return True
+        if elapsed >= self.max_interval:
+            return True
+        if elapsed < self.min_interval:
+            return False
+
+        threshold = max(self.deadband, abs(published) * self.deadband_percent / 100)
+        return abs(value - published) >= threshold
+
+
+class PicoMeasurementSensor(BaseEntity, SensorEntity):
+    """Base class of the Pico sensors publishing readings through a SensorPublishPolicy."""
+
+    _attr_state_class = SensorStateClass.MEASUREMENT
+
+    def __init__(self, coordinator: MainCoordinator, device_index: int, policy: SensorPublishPolicy):
+        """Initialize the sensor."""
+        super().__init__(coordinator, device_index)
+        self._policy = policy
+        self._published_value: float | None = None
+        self._published_at = 0.0
+
+    @property
+    def native_value(self) -> float | None:
+        """Return the last published reading."""
+        return self._published_value
 
-class PicoTemperatureSensor(BaseEntity, SensorEntity):
+    def _read_value(self) -> float | None:
+        """Return the current reading from the coordinator data."""
+        raise NotImplementedError
+
+    def _publish(self, value: float | None) -> None:
+        """Make a reading the sensor's state."""
+        self._published_value = value
+        self._published_at = time.monotonic()
+
+    async def async_added_to_hass(self) -> None:
+        """Start from the current reading."""
+        self._publish(self._read_value())
+        await super().async_added_to_hass()
+
+    def _state_changed(self) -> bool:
+        """Publish the current reading if the policy lets it through."""
+        value = self._read_value()
+        if not self._policy.should_publish(self._published_value, value, time.monotonic() - self._published_at):
+            return False
+
+        self._publish(value)
+        return True
+
+
+class PicoTemperatureSensor(PicoMeasurementSensor):
     """Representation of a Pico Temperature Sensor."""
 
     _attr_translation_key = "temperature"
     _attr_device_class = SensorDeviceClass.TEMPERATURE
-    _attr_state_class = SensorStateClass.MEASUREMENT
     _attr_native_unit_of_measurement = UnitOfTemperature.CELSIUS
     _attr_suggested_display_precision = 1
+    _status_fields = frozenset({"v_tmpr"})
 
-    def __init__(self, coordinator: MainCoordinator, device_index: int):
+    def __init__(self, coordinator: MainCoordinator, device_index: int, policy: SensorPublishPolicy):
         """Initialize the sensor."""
-        super().__init__(coordinator, device_index)
+        super().__init__(coordinator, device_index, policy)
 
         self._attr_unique_id = f"{DOMAIN}_temperature_{coordinator.pico_ip.replace('.', '_')}"
         self._attr_name = "Temperature"
 
-    @property
-    def native_value(self) -> float | None:
-        """Return the state of the sensor."""
+    def _read_value(self) -> float | None:
+        """Return the current reading."""
         if not self.coordinator.data or not self.coordinator.data.sensors or not self.coordinator.data.sensors.temperature:
             return None
         return self.coordinator.data.sensors.temperature_celsius
 
 
-class PicoHumiditySensor(BaseEntity, SensorEntity):
+class PicoHumiditySensor(PicoMeasurementSensor):
     """Representation of a Pico Humidity Sensor."""
 
     _attr_translation_key = "humidity"
     _attr_device_class = SensorDeviceClass.HUMIDITY
-    _attr_state_class = SensorStateClass.MEASUREMENT
     _attr_native_unit_of_measurement = PERCENTAGE
     _attr_suggested_display_precision = 1
+    _status_fields = frozenset({"v_umd"})
 
-    def __init__(self, coordinator: MainCoordinator, device_index: int):
+    def __init__(self, coordinator: MainCoordinator, device_index: int, policy: SensorPublishPolicy):
         """Initialize the sensor."""
-        super().__init__(coordinator, device_index)
+        super().__init__(coordinator, device_index, policy)
 
         self._attr_unique_id = f"{DOMAIN}_humidity_{coordinator.pico_ip.replace('.', '_')}"
         self._attr_name = "Humidity"
 
-    @property
-    def native_value(self) -> float | None:
-        """Return the state of the sensor."""
+    def _read_value(self) -> float | None:
+        """Return the current reading."""
         if not self.coordinator.data or not self.coordinator.data.sensors or not self.coordinator.data.sensors.humidity:
             return None
         return self.coordinator.data.sensors.humidity_percent
 
 
-class PicoAirQualitySensor(BaseEntity, SensorEntity):
+class PicoAirQualitySensor(PicoMeasurementSensor):
     """Representation of a Pico Air Quality (CO2) Sensor."""
 
     _attr_translation_key = "air_quality"
     _attr_device_class = SensorDeviceClass.CO2
-    _attr_state_class = SensorStateClass.MEASUREMENT
     _attr_native_unit_of_measurement = CONCENTRATION_PARTS_PER_MILLION
     _attr_suggested_display_precision = 0
+    _status_fields = frozenset({"v_AirQ"})
 
-    def __init__(self, coordinator: MainCoordinator, device_index: int):
+    def __init__(self, coordinator: MainCoordinator, device_index: int, policy: SensorPublishPolicy):
         """Initialize the sensor."""
-        super().__init__(coordinator, device_index)
+        super().__init__(coordinator, device_index, policy)
 
         self._attr_unique_id = f"{DOMAIN}_air_quality_{coordinator.pico_ip.replace('.', '_')}"
         self._attr_name = "CO2"
 
-    @property
-    def native_value(self) -> int | None:
-        """Return the state of the sensor."""
+    def _read_value(self) -> int | None:
+        """Return the current reading."""
         if not self.coordinator.data or not self.coordinator.data.sensors or not self.coordinator.data.sensors.air_quality:
             return None
         return self.coordinator.data.sensors.air_quality
 
 
-class PicoTVOCSensor(BaseEntity, SensorEntity):
+class PicoTVOCSensor(PicoMeasurementSensor):
     """Representation of a Pico TVOC (Total Volatile Organic Compounds) Sensor."""
 
     _attr_translation_key = "tvoc"
     _attr_device_class = SensorDeviceClass.VOLATILE_ORGANIC_COMPOUNDS_PARTS
-    _attr_state_class = SensorStateClass.MEASUREMENT
     _attr_native_unit_of_measurement = CONCENTRATION_PARTS_PER_MILLION
     _attr_suggested_display_precision = 0
+    _status_fields = frozenset({"v_Tvoc"})
 
-    def __init__(self, coordinator: MainCoordinator, device_index: int):
+    def __init__(self, coordinator: MainCoordinator, device_index: int, policy: SensorPublishPolicy):
         """Initialize the sensor."""
-        super().__init__(coordinator, device_index)
+        super().__init__(coordinator, device_index, policy)
 
         self._attr_unique_id = f"{DOMAIN}_tvoc_{coordinator.pico_ip.replace('.', '_')}"
         self._attr_name = "TVOC"
 
-    @property
-    def native_value(self) -> int | None:
-        """Return the state of the sensor."""
+    def _read_value(self) -> int | None:
+        """Return the current reading."""
         if not self.coordinator.data or not self.coordinator.data.sensors or not self.coordinator.data.sensors.tvoc:
             return None
         return self.coordinator.data.sensors.tvoc
@@ -145,11 +231,10 @@ class PicoTVOCSensor(BaseEntity, SensorEntity):
     @property
     def icon(self) -> str:
         """Return the icon based on TVOC level."""
-        if not self.coordinator.data or not self.coordinator.data.sensors or not self.coordinator.data.sensors.tvoc:
+        tvoc = self.native_value
+        if not tvoc:
             return "mdi:chemical-weapon"
 
-        tvoc = self.coordinator.data.sensors.tvoc
-
         # TVOC level thresholds (ppb or µg/m³)
         # < 220: Excellent
         # 220-660: Good
@@ -169,25 +254,24 @@ class PicoTVOCSensor(BaseEntity, SensorEntity):
             return "mdi:alert-octagon"
 
 
-class PicoECO2Sensor(BaseEntity, SensorEntity):
+class PicoECO2Sensor(PicoMeasurementSensor):
     """Representation of a Pico eCO2 (equivalent CO2) Sensor."""
 
     _attr_translation_key = "eco2"
     _attr_device_class = SensorDeviceClass.CO2
-    _attr_state_class = SensorStateClass.MEASUREMENT
     _attr_native_unit_of_measurement = CONCENTRATION_PARTS_PER_MILLION
     _attr_suggested_display_precision = 0
+    _status_fields = frozenset({"v_ECo2"})
 
-    def __init__(self, coordinator: MainCoordinator, device_index: int):
+    def __init__(self, coordinator: MainCoordinator, device_index: int, policy: SensorPublishPolicy):
         """Initialize the sensor."""
-        super().__init__(coordinator, device_index)
+        super().__init__(coordinator, device_index, policy)
 
         self._attr_unique_id = f"{DOMAIN}_eco2_{coordinator.pico_ip.replace('.', '_')}"
         self._attr_name = "eCO2"
 
-    @property
-    def native_value(self) -> int | None:
-        """Return the state of the sensor."""
+    def _read_value(self) -> int | None:
+        """Return the current reading."""
         if not self.coordinator.data or not self.coordinator.data.sensors or not self.coordinator.data.sensors.eco2:
             return None
         return self.coordinator.data.sensors.eco2
@@ -195,11 +279,10 @@ class PicoECO2Sensor(BaseEntity, SensorEntity):
     @property
     def icon(self) -> str:
         """Return the icon based on eCO2 level."""
-        if not self.coordinator.data or not self.coordinator.data.sensors or not self.coordinator.data.sensors.eco2:
+        eco2 = self.native_value
+        if not eco2:
             return "mdi:molecule-co2"
 
-        eco2 = self.coordinator.data.sensors.eco2
-
         # eCO2 level thresholds (ppm) - similar to CO2
         # < 600: Excellent
         # 600-1000: Good
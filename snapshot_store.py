@@ -0,0 +1,71 @@
+"""Persistence of the last known status of each Open Pico device."""
+from __future__ import annotations
+
+import logging
+import time
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+
+from .open_pico_local_api.models.pico_device_model import PicoDeviceModel
+
+from .const import DOMAIN, SNAPSHOT_SAVE_DELAY, SNAPSHOT_STORAGE_VERSION
+
+_LOGGER = logging.getLogger(__name__)
+
+# Protocol envelope of a status frame, not worth persisting
+_ENVELOPE_FIELDS = ("idp", "frm", "res", "cmd")
+
+
+class SnapshotStore:
+    """
+    Last status frame of every device, kept in Home Assistant storage.
+
+    Snapshots are stored as the raw status frame without its protocol
+    envelope, which PicoDeviceModel.from_dict() turns back into a model.
+    Writes are debounced, so a fleet polled every few seconds costs one
+    write every SNAPSHOT_SAVE_DELAY seconds at most.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the store."""
+        self._store: Store[dict[str, Any]] = Store(hass, SNAPSHOT_STORAGE_VERSION, f"{DOMAIN}.snapshots")
+        self._snapshots: dict[str, dict[str, Any]] = {}
+
+    async def async_load(self) -> None:
+        """Load the persisted snapshots."""
+        try:
+            data = await self._store.async_load()
+        except Exception as err:  # noqa: BLE001
+            _LOGGER.warning("Could not load device snapshots, starting empty: %s", err)
+            data = None
+
+        self._snapshots = (data or {}).get("devices", {})
+        _LOGGER.debug("Loaded %d device snapshot(s)", len(self._snapshots))
+
+    def get(self, device_id: str) -> tuple[PicoDeviceModel, float] | None:
+        """Return a device's last status and the wall-clock time it was saved."""
+        snapshot = self._snapshots.get(device_id)
+        if not snapshot:
+            return None
+
+        try:
+            return PicoDeviceModel.from_dict(dict(snapshot["frame"])), snapshot["saved_at"]
+        except Exception as err:  # noqa: BLE001
+            _LOGGER.debug("[%s] Ignoring unreadable snapshot: %s", device_id, err)
+            return None
+
+    @callback
+    def async_update(self, device_id: str, status: PicoDeviceModel) -> None:
+        """Remember a device's latest status and schedule a write."""
+        self._snapshots[device_id] = {
+            "frame": {key: value for key, value in status.raw_data.items() if key not in _ENVELOPE_FIELDS},
+            "saved_at": time.time(),
+        }
+        self._store.async_delay_save(self._data_to_save, SNAPSHOT_SAVE_DELAY)
+
+    @callback
+    def _data_to_save(self) -> dict[str, Any]:
+        """Return the data written to storage."""
+        return {"devices": self._snapshots}
@@ -41,6 +41,7 @@ class PicoNightModeSwitch(BaseEntity, SwitchEntity):
 
     _attr_translation_key = "night_mode"
     _attr_device_class = SwitchDeviceClass.SWITCH
+    _status_fields = frozenset({"night_mod", "mod"})
 
     def __init__(self, coordinator: MainCoordinator, device_index: int):
         """Initialize the switch."""
@@ -96,6 +97,7 @@ class PicoLEDStatusSwitch(BaseEntity, SwitchEntity):
 
     _attr_translation_key = "led_status"
     _attr_device_class = SwitchDeviceClass.SWITCH
+    _status_fields = frozenset({"led_on_off_breve"})
 
     def __init__(self, coordinator: MainCoordinator, device_index: int):
         """Initialize the switch."""